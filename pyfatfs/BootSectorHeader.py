@@ -11,6 +11,8 @@ class BootSectorHeader(OrderedDict):
 
     #: BPB header layout in struct formatted string
     HEADER_LAYOUT = "<3s8sHBHBHHBHHHLL"
+    #: Precompiled struct of `HEADER_LAYOUT`
+    HEADER_STRUCT = struct.Struct(HEADER_LAYOUT)
     #: BPB header fields when extracted with bpb_header_layout
     HEADER_VARS = ["BS_jmpBoot", "BS_OEMName", "BPB_BytsPerSec",
                    "BPB_SecPerClus", "BPB_RsvdSecCnt", "BPB_NumFATs",
@@ -25,11 +27,11 @@ class BootSectorHeader(OrderedDict):
 
     def __bytes__(self):
         """Serialize header data back to bytes."""
-        return struct.pack(self.HEADER_LAYOUT, *self.values())
+        return self.HEADER_STRUCT.pack(*self.values())
 
     def __len__(self):
         """Return struct size."""
-        return struct.calcsize(self.HEADER_LAYOUT)
+        return self.HEADER_STRUCT.size
 
     def parse_header(self, data: bytes):
         """Parse header data from bytes.
@@ -41,7 +43,7 @@ class BootSectorHeader(OrderedDict):
                              f"for {type(self)}. len(data)={len(data)}, "
                              f"len(header)={len(self)}")
 
-        header = struct.unpack(self.HEADER_LAYOUT, data[:len(self)])
+        header = self.HEADER_STRUCT.unpack_from(data)
         self.update(dict(zip(self.HEADER_VARS, header)))
 
 
@@ -50,6 +52,8 @@ class FAT12BootSectorHeader(BootSectorHeader):
 
     #: FAT12/16 header layout in struct formatted string
     HEADER_LAYOUT = BootSectorHeader.HEADER_LAYOUT + "BBBL11s8s"
+    #: Precompiled struct of `HEADER_LAYOUT`
+    HEADER_STRUCT = struct.Struct(HEADER_LAYOUT)
     #: FAT12/16 header fields when extracted with fat12_header_layout
     HEADER_VARS = BootSectorHeader.HEADER_VARS + \
         ["BS_DrvNum", "BS_Reserved1", "BS_BootSig",
@@ -61,6 +65,8 @@ class FAT32BootSectorHeader(BootSectorHeader):
 
     #: FAT32 header layout in struct formatted string
     HEADER_LAYOUT = BootSectorHeader.HEADER_LAYOUT + "LHHLHH12sBBBL11s8s"
+    #: Precompiled struct of `HEADER_LAYOUT`
+    HEADER_STRUCT = struct.Struct(HEADER_LAYOUT)
     #: FAT32 header fields when extracted with fat32_header_layout
     HEADER_VARS = BootSectorHeader.HEADER_VARS + \
         ["BPB_FATSz32", "BPB_ExtFlags", "BPB_FSVer", "BPB_RootClus",
@@ -3,38 +3,68 @@
 """Enhancement of datetime for DOS date/time format compatibility."""
 from datetime import datetime, time
 
-
-def _convert_to_dos_date(func):
-    """Convert datetime to DosDateTime."""
-    def _wrapper(*args, **kwargs) -> "DosDateTime":
-        date: datetime = func(*args, **kwargs)
-        return DosDateTime(*date.timetuple()[:6])
-    return _wrapper
+#: Bit mask of the 5-bit day and two-second fields
+_MASK_5BIT = 0x1F
+#: Bit mask of the 4-bit month field
+_MASK_4BIT = 0x0F
+#: Bit mask of the 6-bit minute field
+_MASK_6BIT = 0x3F
+#: Bit mask of the 7-bit year field (offset from 1980)
+_MASK_7BIT = 0x7F
 
 
 class DosDateTime(datetime):
     """DOS-specific date/time format serialization."""
 
-    now = _convert_to_dos_date(datetime.now)
-    fromtimestamp = _convert_to_dos_date(datetime.fromtimestamp)
+    @classmethod
+    def __from_datetime(cls, date: datetime) -> "DosDateTime":
+        """Convert datetime to DosDateTime, dropping sub-second precision."""
+        return cls(date.year, date.month, date.day,
+                   date.hour, date.minute, date.second)
+
+    @classmethod
+    def now(cls, tz=None) -> "DosDateTime":
+        """Get current date and time, see `datetime.datetime.now`."""
+        return cls.__from_datetime(datetime.now(tz))
+
+    @classmethod
+    def fromtimestamp(cls, t: float, tz=None) -> "DosDateTime":
+        """Get date and time from POSIX timestamp.
+
+        See `datetime.datetime.fromtimestamp`.
+        """
+        return cls.__from_datetime(datetime.fromtimestamp(t, tz))
 
     def serialize_date(self) -> int:
         """Convert current datetime to FAT date."""
-        date = self.year - 1980 << 9 | self.month << 5 | self.day
-        return date
+        return self.pack_date(self.year, self.month, self.day)
 
     def serialize_time(self) -> int:
-        """Convert current datetime to FAT time."""
-        time = self.hour << 11 | self.minute << 5
-        time |= ((self.second - (self.second % 2)) // 2)
-        return time
+        """Convert current datetime to FAT time.
+
+        FAT stores seconds with a granularity of two seconds.
+        """
+        return self.pack_time(self.hour, self.minute, self.second)
+
+    @staticmethod
+    def pack_date(year: int, month: int, day: int) -> int:
+        """Convert raw date values to FAT date."""
+        return (year - 1980) << 9 | month << 5 | day
+
+    @staticmethod
+    def pack_time(hour: int, minute: int, second: int) -> int:
+        """Convert raw time values to FAT time.
+
+        FAT stores seconds with a granularity of two seconds.
+        """
+        return hour << 11 | minute << 5 | second >> 1
 
     @staticmethod
     def deserialize_date(dt: int) -> "DosDateTime":
         """Convert a DOS date format to a Python object."""
-        day = dt & (1 << 5) - 1
-        month = (dt >> 5) & ((1 << 4) - 1)
-        year = ((dt >> 9) & (1 << 7) - 1) + 1980
+        day = dt & _MASK_5BIT
+        month = (dt >> 5) & _MASK_4BIT
+        year = ((dt >> 9) & _MASK_7BIT) + 1980
 
         try:
             return DosDateTime(year, month, day)
@@ -44,9 +74,9 @@ class DosDateTime(datetime):
     @staticmethod
     def deserialize_time(tm: int) -> time:
         """Convert a DOS time format to a Python object."""
-        second = (tm & (1 << 5) - 1) * 2
-        minute = (tm >> 5) & ((1 << 6) - 1)
-        hour = (tm >> 11) & ((1 << 5) - 1)
+        second = (tm & _MASK_5BIT) << 1
+        minute = (tm >> 5) & _MASK_6BIT
+        hour = (tm >> 11) & _MASK_5BIT
 
         try:
             return time(hour, minute, second)
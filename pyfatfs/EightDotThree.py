@@ -3,24 +3,31 @@
 """8DOT3 file name helper class & functions."""
 
 import errno
-import os
-import struct
+import itertools
 
-from pyfatfs import FAT_OEM_ENCODING, _init_check
+from pyfatfs import FAT_OEM_ENCODING
 from pyfatfs._exceptions import PyFATException, NotAFatEntryException
 
+#: Lookup table for the rotate-right-by-one step of the SFN checksum
+_ROR8 = tuple((i >> 1) | ((i & 1) << 7) for i in range(256))
+
 
 class EightDotThree:
     """8DOT3 filename representation."""
 
+    __slots__ = ("name", "encoding", "initialized",
+                 "__unpadded_name", "__checksum")
+
     #: Length of the byte representation in a directory entry header
     SFN_LENGTH = 11
 
     #: Invalid characters for 8.3 file names
-    INVALID_CHARACTERS = [range(0x0, 0x20)] + [0x22, 0x2A, 0x2B, 0x2C, 0x2E,
-                                               0x2F, 0x3A, 0x3B, 0x3C, 0x3D,
-                                               0x3E, 0x3F, 0x5B, 0x5C, 0x5D,
-                                               0x7C]
+    INVALID_CHARACTERS = frozenset(range(0x0, 0x20)) | \
+        frozenset([0x22, 0x2A, 0x2B, 0x2C, 0x2E, 0x2F, 0x3A, 0x3B,
+                   0x3C, 0x3D, 0x3E, 0x3F, 0x5B, 0x5C, 0x5D, 0x7C])
+    #: Translation table mapping invalid 8.3 characters to underscores
+    _INVALID_CHARACTERS_MAP = bytes.maketrans(
+        bytes(sorted(INVALID_CHARACTERS)), b'_' * len(INVALID_CHARACTERS))
 
     def __init__(self, encoding: str = FAT_OEM_ENCODING):
         """Offer 8DOT3 filename operation.
@@ -31,28 +38,44 @@ class EightDotThree:
         self.name: bytearray = None
         self.encoding = encoding
         self.initialized = False
+        self.__unpadded_name: str = None
+        self.__checksum: int = None
 
     def __str__(self):
         """Decode and un-pad SFN string."""
         name = self.name
         if name[0] == 0x05:
-            # Translate 0x05 to 0xE5
-            name[0] = 0xE5
+            # Translate 0x05 to 0xE5 without touching the on-disk name
+            name = b'\xE5' + name[1:]
 
-        base = name[:8].decode(self.encoding).rstrip()
-        ext = name[8:11].decode(self.encoding).rstrip()
-        sep = "." if len(ext) > 0 else ""
+        # Strip space padding before decoding
+        base = name[:8].rstrip(b' ').decode(self.encoding)
+        ext = name[8:11].rstrip(b' ').decode(self.encoding)
+        if ext:
+            return f"{base}.{ext}"
 
-        return sep.join([base, ext])
+        return base
 
     def __bytes__(self):
         """Byte representation of the 8DOT3 name dir entry headers."""
         return bytes(self.name)
 
-    @_init_check
     def get_unpadded_filename(self) -> str:
-        """Retrieve the human readable filename."""
-        return str(self)
+        """Retrieve the human readable filename.
+
+        The decoded name is cached until a new name is set.
+        """
+        if not self.initialized:
+            self.__raise_uninitialized()
+
+        if self.__unpadded_name is None:
+            self.__unpadded_name = str(self)
+        return self.__unpadded_name
+
+    @staticmethod
+    def __raise_uninitialized():
+        raise PyFATException("Class has not yet been fully initialized, "
+                             "please instantiate first.")
 
     @staticmethod
     def __raise_8dot3_nonconformant(name: str):
@@ -61,14 +84,29 @@ class EightDotThree:
                              f"to 8.3 file naming convention.",
                              errno=errno.EINVAL)
 
-    def __set_name(self, name: bytes):
-        """Set self.name and verify for correctness."""
-        if len(name) != 11:
-            self.__raise_8dot3_nonconformant(name.decode(self.encoding))
+    def __set_name(self, name: bytearray):
+        """Set self.name and reset cached values derived from it."""
+        if len(name) != self.SFN_LENGTH:
+            raise ValueError("Invalid byte name supplied, must be exactly "
+                             "11 bytes long (8+3).")
 
         self.name = name
+        self.__unpadded_name = None
+        self.__checksum = None
         self.initialized = True
 
+    def mark_empty(self):
+        """Set the free directory entry mark (0xE5) as first byte of the name.
+
+        Cached values derived from the name are discarded.
+        """
+        if not self.initialized:
+            self.__raise_uninitialized()
+
+        self.name[0] = 0xE5
+        self.__unpadded_name = None
+        self.__checksum = None
+
     def set_byte_name(self, name: bytes):
         """Set the name as byte input from a directory entry header.
 
@@ -78,8 +116,6 @@ class EightDotThree:
             raise TypeError(f"Given parameter must be of type bytes, "
                             f"but got {type(name)} instead.")
 
-        name = bytearray(name)
-
         if len(name) != 11:
             raise ValueError("Invalid byte name supplied, must be exactly "
                              "11 bytes long (8+3).")
@@ -89,7 +125,8 @@ class EightDotThree:
             raise NotAFatEntryException("Given dir entry is invalid and has "
                                         "no valid name.", free_type=name[0])
 
-        self.__set_name(name)
+        # Copy into a mutable buffer only for actual entries
+        self.__set_name(bytearray(name))
 
     def set_str_name(self, name: str):
         """Set the name as string from user input (i.e. folder creation)."""
@@ -100,39 +137,28 @@ class EightDotThree:
         if not self.is_8dot3_conform(name, self.encoding):
             self.__raise_8dot3_nonconformant(name)
 
-        name = bytearray(self._pad_8dot3_name(name).encode(self.encoding))
+        name = bytearray(self._pad_8dot3_name(name, self.encoding))
         if name[0] == 0xE5:
             name[0] = 0x05
-        self.name = name
-        self.initialized = True
+        self.__set_name(name)
 
-    @_init_check
     def checksum(self) -> int:
         """Calculate checksum of byte string.
 
+        The checksum is cached until a new name is set.
+
         :returns: Checksum as int
         """
-        chksum = 0
-        for c in self.name:
-            chksum = ((chksum >> 1) | (chksum & 1) << 7) + c
-            chksum &= 0xFF
-        return chksum
+        if not self.initialized:
+            self.__raise_uninitialized()
 
-    @staticmethod
-    def __check_characters(name: str, encoding: str) -> bool:
-        """Test if given string contains invalid chars for 8.3 names.
-
-        :param name: `str`: Filename to parse
-        :raises: `ValueError` if the given string contains invalid
-                 8.3 filename characters.
-        """
-        name = name.encode(encoding)
-        name = list(struct.unpack(f"{len(name)}c", name))
-        for c in name:
-            if ord(c) in EightDotThree.INVALID_CHARACTERS:
-                raise ValueError(f"Invalid characters in string '{name}', "
-                                 f"cannot be used as part of an 8.3 "
-                                 f"conform file name.")
+        if self.__checksum is None:
+            ror = _ROR8
+            chksum = 0
+            for c in self.name:
+                chksum = (ror[chksum] + c) & 0xFF
+            self.__checksum = chksum
+        return self.__checksum
 
     @staticmethod
     def is_8dot3_conform(entry_name: str, encoding: str = FAT_OEM_ENCODING):
@@ -142,37 +168,64 @@ class EightDotThree:
         :param encoding: ``str``: Encoding for SFN
         :returns: bool indicating conformance of name to 8.3 standard
         """
+        if len(entry_name) > EightDotThree.SFN_LENGTH + 1:
+            # Cannot fit 8 + 3 characters and the separating dot
+            return False
+
         if entry_name != entry_name.upper():
             # Case sensitivity check
             return False
 
-        root, ext = os.path.splitext(entry_name)
-        ext = ext[1:]
-        if len(root) + len(ext) > 11:
+        root, ext = EightDotThree._split_name(entry_name)
+        try:
+            root = root.encode(encoding)
+            ext = ext.encode(encoding)
+        except UnicodeEncodeError:
             return False
-        elif len(root) > 8 or len(ext) > 3:
+
+        # Characters may take up more than one byte in the given codepage
+        if len(root) > 8 or len(ext) > 3:
             return False
 
         # Check for valid characters in both filename segments
-        for i in [root, ext]:
-            try:
-                EightDotThree.__check_characters(i, encoding=encoding)
-            except ValueError:
-                return False
+        return EightDotThree.INVALID_CHARACTERS.isdisjoint(root + ext)
+
+    @staticmethod
+    def _split_name(name: str) -> tuple:
+        """Split given name into base name and extension.
 
-        return True
+        Leading dots are part of the base name, same as with
+        `os.path.splitext`.
+
+        :param name: `str`: File name to split
+        :returns: `tuple`: Base name and extension without separator
+        """
+        dot = name.rfind('.')
+        if dot > 0 and name[:dot].strip('.'):
+            return name[:dot], name[dot+1:]
+        return name, ""
 
     @staticmethod
-    def _pad_8dot3_name(name: str):
+    def _pad_8dot3_name(name: str, encoding: str = FAT_OEM_ENCODING) -> bytes:
         """Pad 8DOT3 name to 11 bytes for header operations.
 
         This is required to pass the correct value to the `FATDirectoryEntry`
-        constructor as a DIR_Name.
+        constructor as a DIR_Name. Padding is applied after encoding, as
+        characters may take up more than one byte in the given codepage.
+
+        :param name: `str`: 8DOT3 conform name
+        :param encoding: `str`: Encoding for SFN
+        :raises: `PyFATException` if the encoded base name or extension
+                 exceed 8 or 3 bytes respectively
+        :returns: `bytes`: Encoded and padded name
         """
-        root, ext = os.path.splitext(name)
-        ext = ext[1:]
-        name = root.strip().ljust(8) + ext.strip().ljust(3)
-        return name
+        root, ext = EightDotThree._split_name(name)
+        root = root.strip().encode(encoding)
+        ext = ext.strip().encode(encoding)
+        if len(root) > 8 or len(ext) > 3:
+            EightDotThree.__raise_8dot3_nonconformant(name)
+
+        return root.ljust(8) + ext.ljust(3)
 
     @staticmethod
     def make_8dot3_name(dir_name: str,
@@ -193,54 +246,58 @@ class EightDotThree:
                                  are exhausted
         """
         dirs, files, _ = parent_dir_entry.get_entries()
-        dir_entries = [e.get_short_name() for e in dirs + files]
+        dir_entries = {e.get_short_name()
+                       for e in itertools.chain(dirs, files)}
 
         extsep = "."
+        encoding = parent_dir_entry._encoding
 
         def map_chars(name: bytes) -> bytes:
             """Map 8DOT3 valid characters.
 
-            :param name: `str`: input name
-            :returns: `str`: mapped output character
+            :param name: `bytes`: encoded input name
+            :returns: `bytes`: name without spaces and invalid
+                      characters replaced by underscores
             """
-            _name: bytes = b''
-            for b in struct.unpack(f"{len(name)}c", name):
-                if b == b' ':
-                    _name += b''
-                elif ord(b) in EightDotThree.INVALID_CHARACTERS:
-                    _name += b'_'
-                else:
-                    _name += b
-            return _name
-
-        dir_name = dir_name.upper()
-        # Shorten to 8 chars; strip invalid characters
-        basename = os.path.splitext(dir_name)[0][0:8].strip()
-        basename = basename.encode(parent_dir_entry._encoding,
-                                   errors="replace")
-        basename = map_chars(basename).decode(parent_dir_entry._encoding)
-
-        # Shorten to 3 chars; strip invalid characters
-        extname = os.path.splitext(dir_name)[1][1:4].strip()
-        extname = extname.encode(parent_dir_entry._encoding,
-                                 errors="replace")
-        extname = map_chars(extname).decode(parent_dir_entry._encoding)
+            return name.translate(EightDotThree._INVALID_CHARACTERS_MAP, b' ')
 
-        if len(extname) == 0:
-            extsep = ""
+        def shorten(name: str, length: int) -> str:
+            """Shorten name to `length` encoded bytes.
+
+            :param name: `str`: name to shorten
+            :param length: `int`: maximum length in bytes
+            :returns: `str`: name without characters that were cut off
+            """
+            return name.encode(encoding)[:length].decode(encoding,
+                                                         errors="ignore")
 
-        # Loop until suiting name is found
-        i = 0
-        while len(str(i)) + 1 <= 7:
-            if i > 0:
-                maxlen = 8 - (1 + len(str(i)))
-                basename = f"{basename[0:maxlen]}~{i}"
+        basename, extname = EightDotThree._split_name(dir_name.upper())
 
-            short_name = f"{basename}{extsep}{extname}"
+        # Shorten to 8 bytes; strip invalid characters
+        basename = basename[0:8].strip()
+        basename = basename.encode(encoding, errors="replace")
+        basename = shorten(map_chars(basename).decode(encoding), 8)
+
+        # Shorten to 3 bytes; strip invalid characters
+        extname = extname[0:3].strip()
+        extname = extname.encode(encoding, errors="replace")
+        extname = shorten(map_chars(extname).decode(encoding), 3)
+
+        if len(extname) == 0:
+            extsep = ""
 
-            if short_name not in dir_entries:
-                return short_name
-            i += 1
+        short_name = f"{basename}{extsep}{extname}"
+        if short_name not in dir_entries:
+            return short_name
+
+        # Loop until suiting name is found, shortening the base name
+        # whenever the numeric tail gains a digit (i.e. A~999999.TXT)
+        for digits in range(1, 7):
+            prefix = shorten(basename, 8 - (1 + digits))
+            for i in range(10 ** (digits - 1), 10 ** digits):
+                short_name = f"{prefix}~{i}{extsep}{extname}"
+                if short_name not in dir_entries:
+                    return short_name
 
         raise PyFATException("Cannot generate 8dot3 filename, "
                              "unable to find suiting short file name.",
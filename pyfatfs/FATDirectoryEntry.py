@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 """Directory entry operations with PyFAT."""
+import itertools
 import posixpath
 import struct
 import warnings
@@ -19,6 +20,14 @@ import errno
 class FATDirectoryEntry:
     """Represents directory entries in FAT (files & directories)."""
 
+    __slots__ = ("name", "__attr", "ntres", "crttimetenth", "crttime",
+                 "crtdate", "lstaccessdate", "fstclushi", "wrttime",
+                 "wrtdate", "fstcluslo", "__filesize", "__lazy_load",
+                 "__fs", "_parent", "lfn_entry", "__dirs", "__entries",
+                 "__entries_by_name", "__encoding", "__is_read_only",
+                 "__is_hidden", "__is_system", "__is_volume_id",
+                 "__is_directory", "__is_archive")
+
     #: Marks a directory entry as empty
     FREE_DIR_ENTRY_MARK = 0xE5
     #: Marks all directory entries after this one as empty
@@ -45,8 +54,10 @@ class FATDirectoryEntry:
 
     #: Directory entry header layout in struct formatted string
     FAT_DIRECTORY_LAYOUT = "<11sBBBHHHHHHHL"
+    #: Precompiled `struct.Struct` of `FAT_DIRECTORY_LAYOUT`
+    FAT_DIRECTORY_STRUCT = struct.Struct(FAT_DIRECTORY_LAYOUT)
     #: Size of a directory entry header in bytes
-    FAT_DIRECTORY_HEADER_SIZE = struct.calcsize(FAT_DIRECTORY_LAYOUT)
+    FAT_DIRECTORY_HEADER_SIZE = FAT_DIRECTORY_STRUCT.size
     #: Maximum allowed file size, dictated by size of DIR_FileSize
     MAX_FILE_SIZE = 0xFFFFFFFF
     #: Directory entry headers
@@ -84,6 +95,7 @@ class FATDirectoryEntry:
         :param lfn_entry: FATLongDirectoryEntry instance or None
         """
         self.__filesize = 0
+        self._parent = None
 
         self.name: EightDotThree = DIR_Name
         self.attr = int(DIR_Attr)
@@ -101,8 +113,6 @@ class FATDirectoryEntry:
         self.__lazy_load = lazy_load
         self.__fs = fs
 
-        self._parent = None
-
         # Handle LFN entries
         self.lfn_entry = None
         try:
@@ -112,6 +122,8 @@ class FATDirectoryEntry:
                           "long file name.")
 
         self.__dirs = []
+        self.__entries = None
+        self.__entries_by_name = None
         self.__encoding = encoding
 
     @property
@@ -140,6 +152,30 @@ class FATDirectoryEntry:
 
         self.__filesize = size
 
+    @property
+    def attr(self):
+        """Attributes of the directory entry (``DIR_Attr``).
+
+        :getter: Get the currently set attributes
+        :setter: Set new attributes. The results of the ``is_*``
+                 attribute checks are updated and cached entries of
+                 the parent directory are discarded, as the attributes
+                 decide how the entry is classified.
+        :type: int
+        """
+        return self.__attr
+
+    @attr.setter
+    def attr(self, attr: int):
+        self.__attr = attr
+        self.__is_read_only = (self.ATTR_READ_ONLY & attr) > 0
+        self.__is_hidden = (self.ATTR_HIDDEN & attr) > 0
+        self.__is_system = (self.ATTR_SYSTEM & attr) > 0
+        self.__is_volume_id = (self.ATTR_VOLUME_ID & attr) > 0
+        self.__is_directory = (self.ATTR_DIRECTORY & attr) > 0
+        self.__is_archive = (self.ATTR_ARCHIVE & attr) > 0
+        self.__reset_parent_entries_cache()
+
     @staticmethod
     def new(name: EightDotThree, tz: timezone, encoding: str,
             attr: int = 0, ntres: int = 0, cluster: int = 0,
@@ -156,17 +192,19 @@ class FATDirectoryEntry:
         :returns: ``FATDirectoryEntry`` instance
         """
         dt = DosDateTime.now(tz=tz)
+        dos_date = dt.serialize_date()
+        dos_time = dt.serialize_time()
         dentry = FATDirectoryEntry(
             DIR_Name=name,
             DIR_Attr=attr,
             DIR_NTRes=ntres,
             DIR_CrtTimeTenth=0,
-            DIR_CrtTime=dt.serialize_time(),
-            DIR_CrtDate=dt.serialize_date(),
-            DIR_LstAccessDate=dt.serialize_date(),
+            DIR_CrtTime=dos_time,
+            DIR_CrtDate=dos_date,
+            DIR_LstAccessDate=dos_date,
             DIR_FstClusHI=0x00,
-            DIR_WrtTime=dt.serialize_time(),
-            DIR_WrtDate=dt.serialize_date(),
+            DIR_WrtTime=dos_time,
+            DIR_WrtDate=dos_date,
             DIR_FstClusLO=0x00,
             DIR_FileSize=filesize,
             encoding=encoding
@@ -217,6 +255,7 @@ class FATDirectoryEntry:
                                               f'"{self.get_short_name()}" '
                                               f'failed')
         self.lfn_entry = lfn_entry
+        self.__reset_parent_entries_cache()
 
     def get_entry_size(self):
         """Get size of directory entry.
@@ -280,12 +319,12 @@ class FATDirectoryEntry:
         if isinstance(self.lfn_entry, FATLongDirectoryEntry):
             entry += bytes(self.lfn_entry)
 
-        entry += struct.pack(self.FAT_DIRECTORY_LAYOUT,
-                             self.name.name,
-                             self.attr, self.ntres, self.crttimetenth,
-                             self.crttime, self.crtdate, self.lstaccessdate,
-                             self.fstclushi, self.wrttime, self.wrtdate,
-                             self.fstcluslo, self.filesize)
+        entry += self.FAT_DIRECTORY_STRUCT.pack(
+            self.name.name,
+            self.attr, self.ntres, self.crttimetenth,
+            self.crttime, self.crtdate, self.lstaccessdate,
+            self.fstclushi, self.wrttime, self.wrtdate,
+            self.fstcluslo, self.filesize)
 
         return entry
 
@@ -304,27 +343,22 @@ class FATDirectoryEntry:
 
         self._parent = cls
 
-    def _get_parent_dir(self, sd):
-        """Build path name for recursive directory entries."""
-        name = self.__repr__()
-        if self.__repr__() == "/":
-            name = ""
-        sd += [name]
-
-        if self._parent is None:
-            return sd
-
-        return self._parent._get_parent_dir(sd)
-
     def get_full_path(self):
         """Iterate all parents up and join them by "/"."""
-        parent_dirs = [self.__repr__()]
-
         if self._parent is None:
             return "/"
 
-        return posixpath.join(*list(reversed(
-            self._parent._get_parent_dir(parent_dirs))))
+        parent_dirs = [self.__repr__()]
+        parent = self._parent
+        while parent is not None:
+            name = parent.__repr__()
+            if name == "/":
+                name = ""
+            parent_dirs.append(name)
+            parent = parent._parent
+
+        parent_dirs.reverse()
+        return posixpath.join(*parent_dirs)
 
     def get_parent_dir(self):
         """Get the parent directory entry."""
@@ -347,28 +381,28 @@ class FATDirectoryEntry:
 
         :returns: Boolean value indicating read-only attribute is set
         """
-        return (self.ATTR_READ_ONLY & self.attr) > 0
+        return self.__is_read_only
 
     def is_hidden(self):
         """Determine if dir entry has the hidden attribute set.
 
         :returns: Boolean value indicating hidden attribute is set
         """
-        return (self.ATTR_HIDDEN & self.attr) > 0
+        return self.__is_hidden
 
     def is_system(self):
         """Determine if dir entry has the system file attribute set.
 
         :returns: Boolean value indicating system attribute is set
         """
-        return (self.ATTR_SYSTEM & self.attr) > 0
+        return self.__is_system
 
     def is_volume_id(self):
         """Determine if dir entry has the volume ID attribute set.
 
         :returns: Boolean value indicating volume ID attribute is set
         """
-        return (self.ATTR_VOLUME_ID & self.attr) > 0
+        return self.__is_volume_id
 
     def _verify_is_directory(self):
         """Verify that current entry is a directory.
@@ -385,14 +419,14 @@ class FATDirectoryEntry:
 
         :returns: Boolean value indicating directory attribute is set
         """
-        return (self.ATTR_DIRECTORY & self.attr) > 0
+        return self.__is_directory
 
     def is_archive(self):
         """Determine if dir entry has archive attribute set.
 
         :returns: Boolean value indicating archive attribute is set
         """
-        return (self.ATTR_ARCHIVE & self.attr) > 0
+        return self.__is_archive
 
     def is_empty(self):
         """Determine if directory does not contain any directories."""
@@ -415,6 +449,7 @@ class FATDirectoryEntry:
         for dir_entry in self.__dirs:
             dir_entry._add_parent(self)
         self.__lazy_load = False
+        self.__reset_entries_cache()
 
     def _get_entries_raw(self):
         """Get a full list of entries in current directory."""
@@ -426,26 +461,42 @@ class FATDirectoryEntry:
     def get_entries(self):
         """Get entries of directory.
 
+        The returned lists are cached until entries of this directory
+        change and must not be modified by the caller.
+
         :raises: PyFatException: If entry is not a directory
         :returns: tuple: root (current path, full),
                  dirs (all dirs), files (all files)
         """
-        dirs = []
-        files = []
-        specials = []
-
-        for d in self._get_entries_raw():
-            if d.is_special() or d.is_volume_id():
-                # Volume IDs and dot/dotdot entries
-                specials += [d]
-            elif d.is_directory():
-                # Directories
-                dirs += [d]
-            else:
-                # Everything else must be a file
-                files += [d]
-
-        return dirs, files, specials
+        if self.__entries is None:
+            dirs = []
+            files = []
+            specials = []
+
+            for d in self._get_entries_raw():
+                if d.attr & self.ATTR_VOLUME_ID or d.is_special():
+                    # Volume IDs and dot/dotdot entries
+                    specials.append(d)
+                elif d.attr & self.ATTR_DIRECTORY:
+                    # Directories
+                    dirs.append(d)
+                else:
+                    # Everything else must be a file
+                    files.append(d)
+
+            self.__entries = (dirs, files, specials)
+
+        return self.__entries
+
+    def __reset_entries_cache(self):
+        """Discard cached classification and name lookup of entries."""
+        self.__entries = None
+        self.__entries_by_name = None
+
+    def __reset_parent_entries_cache(self):
+        """Discard cached entries of the parent directory, if any."""
+        if self._parent is not None:
+            self._parent.__reset_entries_cache()
 
     def _search_entry(self, name: str):
         """Find given dir entry by walking current dir.
@@ -454,18 +505,33 @@ class FATDirectoryEntry:
         :raises: PyFATException: If entry cannot be found
         :returns: FATDirectoryEntry: Found entry
         """
+        entry = self.__get_entries_by_name().get(name)
+        if entry is None:
+            raise PyFATException(f'Cannot find entry {name}',
+                                 errno=errno.ENOENT)
+
+        return entry
+
+    def __get_entries_by_name(self) -> dict:
+        """Get lookup table of dirs and files by long and short name.
+
+        The table is built on first use and discarded whenever entries
+        are added to or removed from this directory. Names are inserted
+        in directory order and never overwritten, so lookups return the
+        same entry a linear search would.
+        """
+        if self.__entries_by_name is not None:
+            return self.__entries_by_name
+
+        entries_by_name = {}
         dirs, files, _ = self.get_entries()
-        for entry in dirs+files:
-            try:
-                if entry.get_long_name() == name:
-                    return entry
-            except NotAnLFNEntryException:
-                pass
-            if entry.get_short_name() == name:
-                return entry
-
-        raise PyFATException(f'Cannot find entry {name}',
-                             errno=errno.ENOENT)
+        for entry in itertools.chain(dirs, files):
+            if entry.lfn_entry is not None:
+                entries_by_name.setdefault(entry.get_long_name(), entry)
+            entries_by_name.setdefault(entry.get_short_name(), entry)
+
+        self.__entries_by_name = entries_by_name
+        return entries_by_name
 
     def get_entry(self, path: str):
         """Get sub-entry if current entry is a directory.
@@ -486,22 +552,17 @@ class FATDirectoryEntry:
         :returns: tuple: root (current path, full),
                          dirs (all dirs), files (all files)
         """
-        self._verify_is_directory()
-        self.__populate_dirs()
+        # Walk top-down from an explicit stack instead of recursing
+        # into subdirectories, deeply nested trees would otherwise
+        # hit the recursion limit.
+        stack = [self]
+        while stack:
+            entry = stack.pop()
+            dirs, files, _ = entry.get_entries()
 
-        root = self.get_full_path()
-        dirs, files, _ = self.get_entries()
-
-        yield root, dirs, files
-        for d in self.__dirs:
-            if d.is_special():
-                # Ignore dot and dotdot
-                continue
-
-            if not d.is_directory():
-                continue
-
-            yield from d.walk()
+            # Hand out copies, the cached lists must not be modified
+            yield entry.get_full_path(), list(dirs), list(files)
+            stack.extend(reversed(dirs))
 
     def add_subdirectory(self, dir_entry, recursive: bool = True):
         """Register a subdirectory in current directory entry.
@@ -516,7 +577,8 @@ class FATDirectoryEntry:
         self.__populate_dirs()
 
         dir_entry._add_parent(self)
-        self.__dirs += [dir_entry]
+        self.__dirs.append(dir_entry)
+        self.__reset_entries_cache()
 
     def mark_empty(self):
         """Mark this directory entry as empty."""
@@ -526,7 +588,8 @@ class FATDirectoryEntry:
         except AttributeError:
             pass
 
-        self.name.name[0] = self.FREE_DIR_ENTRY_MARK
+        self.name.mark_empty()
+        self.__reset_parent_entries_cache()
 
     def remove_dir_entry(self, name):
         """Remove given dir_entry from dir list.
@@ -537,12 +600,12 @@ class FATDirectoryEntry:
         # Iterate all entries
         for dir_entry in self._get_entries_raw():
             sn = dir_entry.get_short_name()
-            try:
+            ln = None
+            if dir_entry.lfn_entry is not None:
                 ln = dir_entry.get_long_name()
-            except NotAnLFNEntryException:
-                ln = None
             if name in [sn, ln]:
                 self.__dirs.remove(dir_entry)
+                self.__reset_entries_cache()
                 return
 
         raise PyFATException(f"Cannot remove '{name}', no such "
@@ -553,11 +616,11 @@ class FATDirectoryEntry:
 
         :returns: str: Long file name if existing, 8DOT3 otherwise
         """
-        try:
-            return self.get_long_name()
-        except NotAnLFNEntryException:
+        if self.lfn_entry is None:
             return self.get_short_name()
 
+        return self.get_long_name()
+
     def get_short_name(self):
         """Get short name of directory entry.
 
@@ -581,8 +644,12 @@ class FATDirectoryEntry:
 class FATLongDirectoryEntry(object):
     """Represents long file name (LFN) entries."""
 
+    __slots__ = ("lfn_entries", "__name", "__complete")
+
     #: LFN entry header layout in struct formatted string
     FAT_LONG_DIRECTORY_LAYOUT = "<B10sBBB12sH4s"
+    #: Precompiled `struct.Struct` of `FAT_LONG_DIRECTORY_LAYOUT`
+    FAT_LONG_DIRECTORY_STRUCT = struct.Struct(FAT_LONG_DIRECTORY_LAYOUT)
     #: LFN header fields when extracted with `FAT_LONG_DIRECTORY_LAYOUT`
     FAT_LONG_DIRECTORY_VARS = ["LDIR_Ord", "LDIR_Name1", "LDIR_Attr",
                                "LDIR_Type", "LDIR_Chksum", "LDIR_Name2",
@@ -595,6 +662,8 @@ class FATLongDirectoryEntry(object):
     def __init__(self):
         """Initialize empty LFN directory entry object."""
         self.lfn_entries = {}
+        self.__name = None
+        self.__complete = False
 
     def get_entries(self, reverse: bool = False):
         """Get LFS entries in correct order (based on `LDIR_Ord`).
@@ -612,37 +681,43 @@ class FATLongDirectoryEntry(object):
         free_dir_entry_mark = FATDirectoryEntry.FREE_DIR_ENTRY_MARK
         for k in self.lfn_entries.keys():
             self.lfn_entries[k]["LDIR_Ord"] = free_dir_entry_mark
+        self.__name = None
+        self.__complete = False
 
     def __bytes__(self):
         """Represent LFN entries as bytes."""
-        entries_bytes = b""
-        for e in self.get_entries(reverse=True):
-            entries_bytes += struct.pack(self.FAT_LONG_DIRECTORY_LAYOUT,
-                                         e["LDIR_Ord"], e["LDIR_Name1"],
-                                         e["LDIR_Attr"], e["LDIR_Type"],
-                                         e["LDIR_Chksum"], e["LDIR_Name2"],
-                                         e["LDIR_FstClusLO"], e["LDIR_Name3"])
-        return entries_bytes
+        lfn_struct = self.FAT_LONG_DIRECTORY_STRUCT
+        entries_bytes = bytearray(lfn_struct.size * len(self.lfn_entries))
+        for i, e in enumerate(self.get_entries(reverse=True)):
+            lfn_struct.pack_into(entries_bytes, i * lfn_struct.size,
+                                 e["LDIR_Ord"], e["LDIR_Name1"],
+                                 e["LDIR_Attr"], e["LDIR_Type"],
+                                 e["LDIR_Chksum"], e["LDIR_Name2"],
+                                 e["LDIR_FstClusLO"], e["LDIR_Name3"])
+        return bytes(entries_bytes)
 
     def __str__(self):
         """Remove padding from LFN entry and decode it.
 
         :returns: `str` decoded string of filename
         """
-        name = b''
+        if self.__name is not None:
+            return self.__name
 
-        for e in self.get_entries():
-            for h in ["LDIR_Name1", "LDIR_Name2", "LDIR_Name3"]:
-                name += e[h]
+        name = b''.join(e[h] for e in self.get_entries()
+                        for h in ("LDIR_Name1", "LDIR_Name2", "LDIR_Name3"))
 
-        while name.endswith(b'\xFF\xFF'):
-            name = name[:-2]
+        # Strip 0xFFFF padding in UCS-2 code units, slicing only once
+        end = len(name)
+        while end >= 2 and name[end-2] == name[end-1] == 0xFF:
+            end -= 2
 
-        name = name.decode(FAT_LFN_ENCODING)
+        name = name[:end].decode(FAT_LFN_ENCODING)
 
         if name.endswith('\0'):
             name = name[:-1]
 
+        self.__name = name
         return name
 
     @staticmethod
@@ -686,28 +761,29 @@ class FATLongDirectoryEntry(object):
                                  errno=errno.EFAULT)
 
         # Check if item with same index has already been added
-        if LDIR_Ord in self.lfn_entries.keys():
+        if LDIR_Ord in self.lfn_entries:
             raise PyFATException("Given LFN entry part with index \'{}\'"
                                  "has already been added to LFN "
                                  "entry list.".format(LDIR_Ord))
 
-        mapped_entries = dict(zip(self.FAT_LONG_DIRECTORY_VARS,
-                                  (LDIR_Ord, LDIR_Name1, LDIR_Attr, LDIR_Type,
-                                   LDIR_Chksum, LDIR_Name2, LDIR_FstClusLO,
-                                   LDIR_Name3)))
-
-        self.lfn_entries[LDIR_Ord] = mapped_entries
+        self.lfn_entries[LDIR_Ord] = {"LDIR_Ord": LDIR_Ord,
+                                      "LDIR_Name1": LDIR_Name1,
+                                      "LDIR_Attr": LDIR_Attr,
+                                      "LDIR_Type": LDIR_Type,
+                                      "LDIR_Chksum": LDIR_Chksum,
+                                      "LDIR_Name2": LDIR_Name2,
+                                      "LDIR_FstClusLO": LDIR_FstClusLO,
+                                      "LDIR_Name3": LDIR_Name3}
+        self.__name = None
+        if (int(LDIR_Ord) & self.LAST_LONG_ENTRY) == self.LAST_LONG_ENTRY:
+            self.__complete = True
 
     def is_lfn_entry_complete(self):
         """Verify that LFN object forms a complete chain.
 
         :returns: `True` if `LAST_LONG_ENTRY` is found
         """
-        for k in self.lfn_entries.keys():
-            if (int(k) & self.LAST_LONG_ENTRY) == self.LAST_LONG_ENTRY:
-                return True
-
-        return False
+        return self.__complete
 
 
 def make_lfn_entry(dir_name: str,
@@ -720,11 +796,9 @@ def make_lfn_entry(dir_name: str,
              entry or the name exceeds the FAT limitation of 255 characters
     """
     lfn_entry = FATLongDirectoryEntry()
-    #: Length in bytes of an LFN entry
-    lfn_entry_length = 26
+    lfn_entry_length = FATLongDirectoryEntry.LFN_ENTRY_LENGTH
     dir_name_str = dir_name
     dir_name = dir_name.encode(FAT_LFN_ENCODING)
-    dir_name_modulus = len(dir_name) % lfn_entry_length
 
     if EightDotThree.is_8dot3_conform(dir_name_str,
                                       encoding=short_name.encoding):
@@ -739,37 +813,26 @@ def make_lfn_entry(dir_name: str,
 
     checksum = short_name.checksum()
 
-    if dir_name_modulus != 0:
-        # Null-terminate string if required
+    if len(dir_name) % lfn_entry_length != 0:
+        # Null-terminate string and fill the rest with 0xFF
+        # if it doesn't fit evenly
         dir_name += '\0'.encode(FAT_LFN_ENCODING)
-
-    # Fill the rest with 0xFF if it doesn't fit evenly
-    new_sz = lfn_entry_length - len(dir_name)
-    new_sz %= lfn_entry_length
-    new_sz += len(dir_name)
-    dir_name += b'\xFF' * (new_sz - len(dir_name))
+        dir_name += b'\xFF' * (-len(dir_name) % lfn_entry_length)
 
     # Generate linked LFN entries
     lfn_entries = len(dir_name) // lfn_entry_length
     for i in range(lfn_entries):
-        if i == lfn_entries-1:
-            lfn_entry_ord = 0x40 | i+1
-        else:
-            lfn_entry_ord = i+1
+        lfn_entry_ord = i+1
+        if lfn_entry_ord == lfn_entries:
+            lfn_entry_ord |= FATLongDirectoryEntry.LAST_LONG_ENTRY
 
         n = i*lfn_entry_length
-        dirname1 = dir_name[n:n+10]
-        n += 10
-        dirname2 = dir_name[n:n+12]
-        n += 12
-        dirname3 = dir_name[n:n+4]
-
         lfn_entry.add_lfn_entry(LDIR_Ord=lfn_entry_ord,
-                                LDIR_Name1=dirname1,
+                                LDIR_Name1=dir_name[n:n+10],
                                 LDIR_Attr=FATDirectoryEntry.ATTR_LONG_NAME,
                                 LDIR_Type=0x00,
                                 LDIR_Chksum=checksum,
-                                LDIR_Name2=dirname2,
+                                LDIR_Name2=dir_name[n+10:n+22],
                                 LDIR_FstClusLO=0,
-                                LDIR_Name3=dirname3)
+                                LDIR_Name3=dir_name[n+22:n+26])
     return lfn_entry
@@ -18,6 +18,8 @@ class FSInfo(OrderedDict):
 
     #: FSI header layout in struct formatted string
     HEADER_LAYOUT = "<L480xLLL12xL"
+    #: Precompiled struct of `HEADER_LAYOUT`
+    HEADER_STRUCT = struct.Struct(HEADER_LAYOUT)
     #: FSI header fields
     HEADER_VARS = ["FSI_LeasSig",
                    "FSI_StrucSig",
@@ -36,11 +38,11 @@ class FSInfo(OrderedDict):
 
     def __bytes__(self):
         """Serialize header data back to bytes."""
-        return struct.pack(self.HEADER_LAYOUT, *self.values())
+        return self.HEADER_STRUCT.pack(*self.values())
 
     def __len__(self):
         """Return struct size."""
-        return struct.calcsize(self.HEADER_LAYOUT)
+        return self.HEADER_STRUCT.size
 
     def parse_header(self, data: bytes) -> "FSInfo":
         """Deserialize FSInfo binary data into FSInfo class instance.
@@ -52,5 +54,5 @@ class FSInfo(OrderedDict):
                              f"for {type(self)}. len(data)={len(data)}, "
                              f"len(header)={len(self)}")
 
-        fsinfo = struct.unpack(self.HEADER_LAYOUT, data[:len(self)])
+        fsinfo = self.HEADER_STRUCT.unpack_from(data)
         self.update(dict(zip(self.HEADER_VARS, fsinfo)))
@@ -3,6 +3,7 @@
 """Implementation of `FatIO` for basic I/O."""
 import errno
 import io
+import itertools
 import threading
 from typing import Union, Optional
 
@@ -133,40 +134,68 @@ class FatIO(io.RawIOBase):
             if size + self.__bpos > self.dir_entry.filesize or size < 0:
                 size = self.dir_entry.filesize - self.__bpos
 
-            if size == 0:
+            if size <= 0:
                 return b""
 
-            chunks = []
-            read_bytes = 0
-            cluster_offset = self.__coffpos
-            for c in self.fs.get_cluster_chain(self.__cpos):
-                chunk_size = self.fs.bytes_per_cluster - cluster_offset
-                # Do not read past EOF
-                if read_bytes + chunk_size > size:
-                    chunk_size = size - read_bytes
-
-                chunk = self.fs.read_cluster_contents(c)
-                chunk = chunk[cluster_offset:][:chunk_size]
-                cluster_offset = 0
-                chunks.append(chunk)
-                read_bytes += chunk_size
-                if read_bytes == size:
-                    break
-
-            self.seek(read_bytes, 1)
-
-            chunks = b"".join(chunks)
-            if len(chunks) != size:
-                raise RuntimeError("Read a different amount of data "
-                                   "than was requested.")
-            return chunks
+            data = bytearray(size)
+            self.__readinto(memoryview(data))
+            return bytes(data)
 
     def readinto(self, __buffer: bytearray) -> Optional[int]:
-        """Read data "directly" into bytearray."""
-        data = self.read(len(__buffer))
-        bytes_read = len(data)
-        __buffer[:bytes_read] = data
-        return bytes_read
+        """Read data directly into bytearray."""
+        if not self.mode.reading:
+            raise IOError("File not open for reading")
+
+        with self._lock:
+            size = min(len(__buffer),
+                       self.dir_entry.filesize - self.__bpos)
+            if size <= 0:
+                return 0
+
+            return self.__readinto(memoryview(__buffer).cast('B')[:size])
+
+    def __readinto(self, buffer: memoryview) -> int:
+        """Fill given buffer with data from the current position."""
+        bytes_per_cluster = self.fs.bytes_per_cluster
+        size = len(buffer)
+        start = self.__coffpos
+        # Only follow the cluster chain as far as the requested data reaches
+        num_clusters = -(-(start + size) // bytes_per_cluster)
+        clusters = list(itertools.islice(
+            self.fs.get_cluster_chain(self.__cpos), num_clusters))
+
+        read_bytes = 0
+        run_start = 0
+        for i in range(1, len(clusters) + 1):
+            if i < len(clusters) and clusters[i] == clusters[i-1] + 1:
+                # Consecutive on disk, read together with the current run
+                continue
+
+            offset = start + read_bytes - run_start * bytes_per_cluster
+            chunk_size = min((i - run_start) * bytes_per_cluster - offset,
+                             size - read_bytes)
+            if chunk_size > 0:
+                chunk = buffer[read_bytes:read_bytes+chunk_size]
+                chunk_read = self.fs.read_cluster_contents_into(
+                    clusters[run_start], chunk, offset, i - run_start)
+                read_bytes += chunk_read
+                if chunk_read != chunk_size:
+                    break
+            run_start = i
+
+        # Advance position to where reading stopped, a full seek
+        # would walk the cluster chain that was just read once more
+        end = start + read_bytes
+        index = max(end - 1, 0) // bytes_per_cluster
+        self.__bpos += read_bytes
+        self.__cpos = clusters[index]
+        self.__cindex += index
+        self.__coffpos = end - index * bytes_per_cluster
+
+        if read_bytes != size:
+            raise RuntimeError("Read a different amount of data "
+                               "than was requested.")
+        return read_bytes
 
     def writable(self) -> bool:
         """Determine whether the file is writable."""
@@ -201,8 +230,9 @@ class FatIO(io.RawIOBase):
         else:
             # Rewrite from current cluster
             if self.__coffpos != 0:
-                cluster_data = self.fs.read_cluster_contents(self.__cpos)
-                __b = cluster_data[0:self.__coffpos] + __b
+                cluster_data = self.fs.read_cluster_contents(
+                    self.__cpos, size=self.__coffpos)
+                __b = cluster_data + __b
 
         self.fs.write_data_to_cluster(__b, self.__cpos)
         if self.__bpos + sz > self.dir_entry.filesize:
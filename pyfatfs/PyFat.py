@@ -3,39 +3,43 @@
 
 """FAT and BPB parsing for files."""
 
+import array
 import datetime
 import errno
+import functools
 
 import math
 import struct
+import sys
 import threading
 import time
 import warnings
 
+from collections import deque
 from contextlib import contextmanager
 from io import FileIO, open, BytesIO, IOBase, SEEK_END
 from os import PathLike
 from typing import Union
 
 from pyfatfs import FAT_OEM_ENCODING, _init_check
+from pyfatfs.DosDateTime import DosDateTime
 from pyfatfs.EightDotThree import EightDotThree
 from pyfatfs.FATDirectoryEntry import FATDirectoryEntry, FATLongDirectoryEntry
 from pyfatfs.FSInfo import FSInfo
-from pyfatfs._exceptions import PyFATException, NotAFatEntryException
+from pyfatfs._exceptions import PyFATException
 from pyfatfs.BootSectorHeader import BootSectorHeader, FAT12BootSectorHeader, \
                                      FAT32BootSectorHeader
 
 
 def _readonly_check(func):
-    def _wrapper(*args, **kwargs):
-        read_only = args[0].is_read_only
+    @functools.wraps(func)
+    def _wrapper(self, *args, **kwargs):
+        if self.is_read_only is False:
+            return func(self, *args, **kwargs)
 
-        if read_only is False:
-            return func(*args, **kwargs)
-        else:
-            raise PyFATException("Filesystem has been opened read-only, not "
-                                 "able to perform a write operation!",
-                                 errno=errno.EROFS)
+        raise PyFATException("Filesystem has been opened read-only, not "
+                             "able to perform a write operation!",
+                             errno=errno.EROFS)
 
     return _wrapper
 
@@ -97,6 +101,9 @@ class PyFat(object):
     #: Dirty bit in FAT header
     FAT_DIRTY_BIT_MASK = 0x01
 
+    #: Number of bytes to compare at once when checking FAT copies
+    FAT_COMPARE_CHUNK_SIZE = 64 * 1024
+
     def __init__(self,
                  encoding: str = 'ibm437',
                  offset: int = 0,
@@ -117,6 +124,7 @@ class PyFat(object):
         self.root_dir_sectors = 0
         self.bytes_per_cluster = 0
         self.first_data_sector = 0
+        self.__first_data_byte = 0
         self.first_free_cluster = 0
         self.fat_type = self.FAT_TYPE_UNKNOWN
         self.fat = {}
@@ -141,18 +149,45 @@ class PyFat(object):
         self.__fp.seek(address + self.__fp_offset)
 
     @_init_check
-    def read_cluster_contents(self, cluster: int) -> bytes:
+    def read_cluster_contents(self, cluster: int, offset: int = 0,
+                              size: int = -1) -> bytes:
         """Read contents of given cluster.
 
         :param cluster: Cluster number to read contents from
+        :param offset: Offset in bytes within the cluster to start reading
+        :param size: Number of bytes to read, defaults to the
+                     remainder of the cluster
         :returns: Contents of cluster as `bytes`
         """
-        sz = self.bytes_per_cluster
+        sz = self.bytes_per_cluster - offset
+        if 0 <= size < sz:
+            sz = size
         cluster_address = self.get_data_cluster_address(cluster)
         with self.__lock:
-            self.__seek(cluster_address)
+            self.__seek(cluster_address + offset)
             return self.__fp.read(sz)
 
+    @_init_check
+    def read_cluster_contents_into(self, cluster: int, buffer: memoryview,
+                                   offset: int = 0,
+                                   num_clusters: int = 1) -> int:
+        """Read contents of given cluster directly into a buffer.
+
+        :param cluster: Cluster number to read contents from
+        :param buffer: Writable bytes-like object to fill, at most
+                       up to the end of the last cluster read
+        :param offset: Offset in bytes within the cluster to start reading
+        :param num_clusters: Number of consecutive clusters on disk,
+                             starting with `cluster`, to read at once
+        :returns: Number of bytes read into `buffer`
+        """
+        buffer = memoryview(buffer)[:num_clusters * self.bytes_per_cluster -
+                                    offset]
+        cluster_address = self.get_data_cluster_address(cluster)
+        with self.__lock:
+            self.__seek(cluster_address + offset)
+            return self.__fp.readinto(buffer)
+
     def __get_clean_shutdown_bitmask(self):
         """Get clean shutdown bitmask for current FS.
 
@@ -296,16 +331,32 @@ class PyFat(object):
         # Seek FAT entries
         first_fat_bytes = self.bpb_header["BPB_RsvdSecCnt"]
         first_fat_bytes *= self.bpb_header["BPB_BytsPerSec"]
-        fats = []
-        for i in range(self.bpb_header["BPB_NumFATs"]):
-            with self.__lock:
-                self.__seek(first_fat_bytes + (i * fat_size))
-                fats += [self.__fp.read(fat_size)]
-
-        if len(fats) < 1:
+        num_fats = self.bpb_header["BPB_NumFATs"]
+        if num_fats < 1:
             raise PyFATException("Invalid number of FATs configured, "
                                  "cannot continue")
-        elif len(set(fats)) > 1:
+
+        with self.__lock:
+            self.__seek(first_fat_bytes)
+            fat = self.__fp.read(fat_size)
+
+            # Compare further FATs chunk-wise against the first FAT
+            # instead of keeping all of them in memory
+            first_fat = memoryview(fat)
+            chunk_size = self.FAT_COMPARE_CHUNK_SIZE
+            fats_differ = False
+            for i in range(1, num_fats):
+                self.__seek(first_fat_bytes + (i * fat_size))
+                for offset in range(0, fat_size, chunk_size):
+                    end = min(offset + chunk_size, fat_size)
+                    chunk = self.__fp.read(end - offset)
+                    if chunk != first_fat[offset:end]:
+                        fats_differ = True
+                        break
+                if fats_differ:
+                    break
+
+        if fats_differ:
             warnings.warn("One or more FATs differ, filesystem most "
                           "likely corrupted. Using first FAT.")
 
@@ -313,64 +364,60 @@ class PyFat(object):
         self.bytes_per_cluster = self.bpb_header["BPB_BytsPerSec"] * \
             self.bpb_header["BPB_SecPerClus"]
 
-        if len(fats[0]) != self.bpb_header["BPB_BytsPerSec"] * self._fat_size:
+        if len(fat) != self.bpb_header["BPB_BytsPerSec"] * self._fat_size:
             raise PyFATException("Invalid length of FAT")
 
         # FAT12: 12 bits (1.5 bytes) per FAT entry
         # FAT16: 16 bits (2 bytes) per FAT entry
         # FAT32: 32 bits (4 bytes) per FAT entry
-        fat_entry_size = self.fat_type / 8
-        total_entries = int(fat_size // fat_entry_size)
-        self.fat = [None] * total_entries
-
-        curr = 0
-        cluster = 0
-        incr = self.fat_type / 8
-        while curr < fat_size:
-            offset = curr + incr
-
-            if self.fat_type == self.FAT_TYPE_FAT12:
-                fat_nibble = fats[0][int(curr):math.ceil(offset)]
-                fat_nibble = fat_nibble.ljust(2, b"\0")
-                try:
-                    self.fat[cluster] = struct.unpack("<H", fat_nibble)[0]
-                except IndexError:
-                    # Out of bounds, FAT size is not cleanly divisible by 3
-                    # Do not touch last clusters
-                    break
-
-                if cluster % 2 == 0:
-                    # Even: Keep low 12-bits of word
-                    self.fat[cluster] &= 0x0FFF
-                else:
-                    # Odd: Keep high 12-bits of word
-                    self.fat[cluster] >>= 4
+        if self.fat_type == self.FAT_TYPE_FAT12:
+            # Every three bytes hold two entries: The even entry is made
+            # of the low 12 bits, the odd entry of the high 12 bits.
+            even = [lo | (mid & 0x0F) << 8
+                    for lo, mid in zip(fat[0::3], fat[1::3])]
+            odd = [mid >> 4 | hi << 4
+                   for mid, hi in zip(fat[1::3], fat[2::3])]
+            self.fat = [0] * (len(even) + len(odd))
+            self.fat[0::2] = even
+            self.fat[1::2] = odd
+            if len(odd) == len(even):
+                # Sector boundary case for FAT12: Do not touch last cluster
+                del self.fat[-1]
+        elif self.fat_type == self.FAT_TYPE_FAT16:
+            self.fat = self.__unpack_fat_entries("H", fat).tolist()
+        elif self.fat_type == self.FAT_TYPE_FAT32:
+            # Ignore first four bits, FAT32 clusters are
+            # actually just 28bits long
+            self.fat = [e & 0x0FFFFFFF
+                        for e in self.__unpack_fat_entries("I", fat)]
+        else:
+            raise PyFATException("Unknown FAT type, cannot continue")
 
-                if math.ceil(offset) == (fat_size - 1):
-                    # Sector boundary case for FAT12
-                    del self.fat[-1]
-                    break
+    @staticmethod
+    def __unpack_fat_entries(typecode: str, fat: bytes) -> array.array:
+        """Unpack little endian FAT entries of the given array typecode.
 
-            elif self.fat_type == self.FAT_TYPE_FAT16:
-                self.fat[cluster] = struct.unpack("<H",
-                                                  fats[0][int(curr):
-                                                          int(offset)])[0]
-            elif self.fat_type == self.FAT_TYPE_FAT32:
-                self.fat[cluster] = struct.unpack("<L",
-                                                  fats[0][int(curr):
-                                                          int(offset)])[0]
-                # Ignore first four bits, FAT32 clusters are
-                # actually just 28bits long
-                self.fat[cluster] &= 0x0FFFFFFF
-            else:
-                raise PyFATException("Unknown FAT type, cannot continue")
+        :param typecode: `str`: `array` typecode of a FAT entry
+        :param fat: `bytes`: Raw FAT data
+        :returns: `array.array` of FAT entries
+        """
+        entries = array.array(typecode, fat)
+        if sys.byteorder != "little":
+            entries.byteswap()
+        return entries
 
-            curr += incr
-            cluster += 1
+    @staticmethod
+    def __pack_fat_entries(typecode: str, fat: list) -> bytes:
+        """Pack FAT entries of the given array typecode as little endian.
 
-        if None in self.fat:
-            raise AssertionError("Unknown error during FAT parsing, please "
-                                 "report this error.")
+        :param typecode: `str`: `array` typecode of a FAT entry
+        :param fat: `list`: FAT entries
+        :returns: `bytes` of the raw FAT
+        """
+        entries = array.array(typecode, fat)
+        if sys.byteorder != "little":
+            entries.byteswap()
+        return entries.tobytes()
 
     @_init_check
     def __bytes__(self):
@@ -378,26 +425,28 @@ class PyFat(object):
 
         :returns: `bytes` representation of FAT.
         """
-        b = b''
         if self.fat_type == self.FAT_TYPE_FAT12:
-            for i, e in enumerate(self.fat):
-                if i % 2 == 0:
-                    b += struct.pack("<H", e)
-                else:
-                    nibble = b[-1:]
-                    nibble = struct.unpack("<B", nibble)[0]
-                    b = b[:-1]
-                    b += struct.pack("<BB", ((e & 0xF) << 4) | nibble, e >> 4)
-
+            # Every two entries are packed into three bytes, a trailing
+            # even entry still takes up two bytes.
+            even = self.fat[0::2]
+            odd = self.fat[1::2]
+            mid = [((o & 0xF) << 4) | (e >> 8) for e, o in zip(even, odd)]
+            if len(even) > len(odd):
+                mid.append(even[-1] >> 8)
+
+            b = bytearray(len(even) + len(mid) + len(odd))
+            b[0::3] = bytes([e & 0xFF for e in even])
+            b[1::3] = bytes(mid)
+            b[2::3] = bytes([o >> 4 for o in odd])
+            b = bytes(b)
         else:
             if self.fat_type == self.FAT_TYPE_FAT16:
-                fmt = "H"
+                typecode = "H"
             else:
                 # FAT32
-                fmt = "L"
+                typecode = "I"
 
-            b = struct.pack(f"<{fmt * len(self.fat)}",
-                            *self.fat)
+            b = self.__pack_fat_entries(typecode, self.fat)
         return b
 
     @_init_check
@@ -520,42 +569,42 @@ class PyFat(object):
                               space is zeroed-out for clean allocation.
         :returns: List of newly-allocated clusters.
         """
-        free_clus = self.FAT_CLUSTER_VALUES[self.fat_type]["FREE_CLUSTER"]
-        min_clus = self.FAT_CLUSTER_VALUES[self.fat_type]["MIN_DATA_CLUSTER"]
-        max_clus = self.FAT_CLUSTER_VALUES[self.fat_type]["MAX_DATA_CLUSTER"]
+        cluster_vals = self.FAT_CLUSTER_VALUES[self.fat_type]
+        free_clus = cluster_vals["FREE_CLUSTER"]
+        min_clus = cluster_vals["MIN_DATA_CLUSTER"]
+        max_clus = cluster_vals["MAX_DATA_CLUSTER"]
+        bad_clus = cluster_vals["BAD_CLUSTER"]
+        is_fat12 = self.fat_type == self.FAT_TYPE_FAT12
         num_clusters = self.calc_num_clusters(size)
 
-        # Fill list of found free clusters
+        # Fill list of found free clusters, let list.index() do the
+        # scanning for free entries within the data cluster bounds
         free_clusters = []
-        for i in range(self.first_free_cluster, len(self.fat)):
-            if min_clus > i or i > max_clus:
-                # Ignore out of bound entries
-                continue
-
-            if num_clusters == len(free_clusters):
-                # Allocated enough clusters!
-                break
-
-            if self.fat[i] == free_clus:
-                if i == self.FAT_CLUSTER_VALUES[self.fat_type]["BAD_CLUSTER"]:
-                    # Do not allocate a BAD_CLUSTER
-                    continue
-
-                if self.fat_type == self.FAT_TYPE_FAT12 and \
-                        i == self.FAT12_SPECIAL_EOC:
-                    # Do not allocate special EOC marker on FAT12
-                    continue
-
-                free_clusters += [i]
-        else:
-            free_space = len(free_clusters) * self.bytes_per_cluster
-            raise PyFATException(f"Not enough free space to allocate "
-                                 f"{size} bytes ({free_space} bytes free)",
-                                 errno=errno.ENOSPC)
+        fat = self.fat
+        i = max(self.first_free_cluster, min_clus)
+        end = min(len(fat), max_clus + 1)
+        while len(free_clusters) < num_clusters:
+            try:
+                i = fat.index(free_clus, i, end)
+            except ValueError:
+                free_space = len(free_clusters) * self.bytes_per_cluster
+                raise PyFATException(f"Not enough free space to allocate "
+                                     f"{size} bytes ({free_space} bytes "
+                                     f"free)", errno=errno.ENOSPC)
+
+            if i == bad_clus:
+                # Do not allocate a BAD_CLUSTER
+                pass
+            elif is_fat12 and i == self.FAT12_SPECIAL_EOC:
+                # Do not allocate special EOC marker on FAT12
+                pass
+            else:
+                free_clusters.append(i)
+            i += 1
         self.first_free_cluster = i
 
         # Allocate cluster chain in FAT
-        eoc_max = self.FAT_CLUSTER_VALUES[self.fat_type]["END_OF_CLUSTER_MAX"]
+        eoc_max = cluster_vals["END_OF_CLUSTER_MAX"]
         for i, _ in enumerate(free_clusters):
             try:
                 self.fat[free_clusters[i]] = free_clusters[i+1]
@@ -590,9 +639,8 @@ class PyFat(object):
             is_root_dir = True
 
         # Gather all directory entries
-        dir_entries = b''
-        for d in dir_entry._get_entries_raw():
-            dir_entries += bytes(d)
+        dir_entries = b''.join(bytes(d)
+                               for d in dir_entry._get_entries_raw())
 
         # Write content
         if not is_root_dir or self.fat_type == self.FAT_TYPE_FAT32:
@@ -686,24 +734,9 @@ class PyFat(object):
             self.__seek(address)
             lfn_dir_data = self.__fp.read(dir_hdr_sz)
 
-        lfn_hdr_layout = FATLongDirectoryEntry.FAT_LONG_DIRECTORY_LAYOUT
-        lfn_dir_hdr = struct.unpack(lfn_hdr_layout, lfn_dir_data)
-        lfn_dir_hdr = dict(zip(FATLongDirectoryEntry.FAT_LONG_DIRECTORY_VARS,
-                               lfn_dir_hdr))
-
-        lfn_entry.add_lfn_entry(**lfn_dir_hdr)
-
-    def __parse_dir_entry(self, address):
-        """Parse directory entry at given address."""
-        with self.__lock:
-            self.__seek(address)
-            dir_hdr_size = FATDirectoryEntry.FAT_DIRECTORY_HEADER_SIZE
-            dir_data = self.__fp.read(dir_hdr_size)
-
-        dir_hdr = struct.unpack(FATDirectoryEntry.FAT_DIRECTORY_LAYOUT,
-                                dir_data)
-        dir_hdr = dict(zip(FATDirectoryEntry.FAT_DIRECTORY_VARS, dir_hdr))
-        return dir_hdr
+        lfn_hdr_struct = FATLongDirectoryEntry.FAT_LONG_DIRECTORY_STRUCT
+        # Fields are unpacked in the positional order of add_lfn_entry
+        lfn_entry.add_lfn_entry(*lfn_hdr_struct.unpack(lfn_dir_data))
 
     def parse_dir_entries_in_address(self,
                                      address: int = 0,
@@ -711,39 +744,55 @@ class PyFat(object):
                                      tmp_lfn_entry: FATLongDirectoryEntry =
                                      None):
         """Parse directory entries in address range."""
+        if max_address == 0:
+            max_address = FATDirectoryEntry.FAT_DIRECTORY_HEADER_SIZE
+
+        # Read the whole address range at once and unpack entries from it
+        with self.__lock:
+            self.__seek(address)
+            dir_data = self.__fp.read(max_address - address)
+
+        dir_entries, tmp_lfn_entry, _ = self.__parse_dir_entries(
+            dir_data, tmp_lfn_entry)
+        if not self.lazy_load:
+            self.__parse_subdirectories(dir_entries)
+        return dir_entries, tmp_lfn_entry
+
+    def __parse_dir_entries(self, dir_data: bytes,
+                            tmp_lfn_entry: FATLongDirectoryEntry = None):
+        """Parse directory entries from raw directory data.
+
+        :param dir_data: `bytes`: Raw directory entries
+        :param tmp_lfn_entry: `FATLongDirectoryEntry`: LFN entry carried
+                              over from previously parsed data
+        :returns: Tuple of parsed directory entries, the pending LFN entry
+                  and whether the end of directory mark was reached
+        """
         if tmp_lfn_entry is None:
             tmp_lfn_entry = FATLongDirectoryEntry()
 
-        dir_hdr_size = FATDirectoryEntry.FAT_DIRECTORY_HEADER_SIZE
-
-        if max_address == 0:
-            max_address = FATDirectoryEntry.FAT_DIRECTORY_HEADER_SIZE
+        dir_hdr_struct = FATDirectoryEntry.FAT_DIRECTORY_STRUCT
+        lfn_hdr_struct = FATLongDirectoryEntry.FAT_LONG_DIRECTORY_STRUCT
+        dir_hdr_size = dir_hdr_struct.size
 
         dir_entries = []
 
-        for hdr_addr in range(address, max_address, dir_hdr_size):
-            # Parse each entry
-            dir_hdr = self.__parse_dir_entry(hdr_addr)
-            dir_sn = EightDotThree(encoding=self.encoding)
-            dir_first_byte = dir_hdr["DIR_Name"][0]
-            try:
-                dir_sn.set_byte_name(dir_hdr["DIR_Name"])
-            except NotAFatEntryException as ex:
-                # Not a directory of any kind, invalidate temporary LFN entries
+        for i, dir_hdr in enumerate(dir_hdr_struct.iter_unpack(dir_data)):
+            dir_first_byte = dir_hdr[0][0]
+            if dir_first_byte == FATDirectoryEntry.FREE_DIR_ENTRY_MARK:
+                # Empty directory entry, invalidate temporary LFN entries
                 tmp_lfn_entry = FATLongDirectoryEntry()
-                if ex.free_type == FATDirectoryEntry.FREE_DIR_ENTRY_MARK:
-                    # Empty directory entry,
-                    continue
-                elif ex.free_type == FATDirectoryEntry.LAST_DIR_ENTRY_MARK:
-                    # Last directory entry, do not parse any further
-                    break
-            else:
-                dir_hdr["DIR_Name"] = dir_sn
+                continue
+            elif dir_first_byte == FATDirectoryEntry.LAST_DIR_ENTRY_MARK:
+                # Last directory entry, do not parse any further
+                return dir_entries, FATLongDirectoryEntry(), True
 
             # Long File Names
             if FATLongDirectoryEntry.is_lfn_entry(dir_first_byte,
-                                                  dir_hdr["DIR_Attr"]):
-                self.parse_lfn_entry(tmp_lfn_entry, hdr_addr)
+                                                  dir_hdr[1]):
+                lfn_hdr = lfn_hdr_struct.unpack_from(dir_data,
+                                                     i * dir_hdr_size)
+                tmp_lfn_entry.add_lfn_entry(*lfn_hdr)
                 continue
 
             # Normal directory entries
@@ -751,42 +800,85 @@ class PyFat(object):
                 # Ignore incomplete LFN entries altogether
                 tmp_lfn_entry = None
 
-            dir_entry = FATDirectoryEntry(fs=self,
+            dir_sn = EightDotThree(encoding=self.encoding)
+            dir_sn.set_byte_name(dir_hdr[0])
+            dir_entry = FATDirectoryEntry(dir_sn, *dir_hdr[1:],
+                                          fs=self,
                                           encoding=self.encoding,
                                           lfn_entry=tmp_lfn_entry,
-                                          lazy_load=self.lazy_load,
-                                          **dir_hdr)
-            dir_entries += [dir_entry]
-
-            if not self.lazy_load:
-                if dir_entry.is_directory() and not dir_entry.is_special():
-                    # Iterate all subdirectories except for dot and dotdot
-                    cluster = dir_entry.get_cluster()
-                    subdirs = self.parse_dir_entries_in_cluster_chain(cluster)
-                    for d in subdirs:
-                        dir_entry.add_subdirectory(d)
+                                          lazy_load=self.lazy_load)
+            dir_entries.append(dir_entry)
 
             # Reset temporary LFN entry
             tmp_lfn_entry = FATLongDirectoryEntry()
 
-        return dir_entries, tmp_lfn_entry
+        return dir_entries, tmp_lfn_entry, False
 
     def parse_dir_entries_in_cluster_chain(self, cluster) -> list:
-        """Parse directory entries while following given cluster chain."""
+        """Parse directory entries while following given cluster chain.
+
+        Stops following the cluster chain once the end of directory
+        mark has been found, as all subsequent entries are free.
+        """
+        dir_entries = self.__parse_dir_entries_in_cluster_chain(cluster)
+        if not self.lazy_load:
+            self.__parse_subdirectories(dir_entries)
+        return dir_entries
+
+    def __parse_dir_entries_in_cluster_chain(self, cluster: int) -> list:
+        """Parse directory entries of a single directory's cluster chain."""
         dir_entries = []
         tmp_lfn_entry = FATLongDirectoryEntry()
-        max_bytes = (self.bpb_header["BPB_SecPerClus"] *
-                     self.bpb_header["BPB_BytsPerSec"])
-        for c in self.get_cluster_chain(cluster):
-            # Parse all directory entries in chain
+        for c, num_clusters in self.get_cluster_chain_runs(cluster):
+            # Read consecutive clusters of the chain at once
             b = self.get_data_cluster_address(c)
-            ret = self.parse_dir_entries_in_address(b, b+max_bytes,
-                                                    tmp_lfn_entry)
-            tmp_dir_entries, tmp_lfn_entry = ret
+            with self.__lock:
+                self.__seek(b)
+                dir_data = self.__fp.read(num_clusters *
+                                          self.bytes_per_cluster)
+
+            # Parse all directory entries in chain
+            ret = self.__parse_dir_entries(dir_data, tmp_lfn_entry)
+            tmp_dir_entries, tmp_lfn_entry, end_of_dir = ret
             dir_entries += tmp_dir_entries
+            if end_of_dir:
+                break
 
         return dir_entries
 
+    def __parse_subdirectories(self, dir_entries: list):
+        """Parse all subdirectories of given directory entries.
+
+        Directories are processed from a work queue instead of
+        recursively, so the depth of the directory tree is not limited
+        by the interpreter's recursion limit.
+
+        :param dir_entries: `list` of `FATDirectoryEntry` to descend into
+        :raises: PyFATException: If a directory contains one of its
+                                 parent directories
+        """
+        queue = deque(dir_entries)
+        while queue:
+            dir_entry = queue.popleft()
+            if not dir_entry.is_directory() or dir_entry.is_special():
+                # Iterate all subdirectories except for dot and dotdot
+                continue
+
+            cluster = dir_entry.get_cluster()
+            parent = dir_entry._parent
+            while parent is not None:
+                if parent.get_cluster() == cluster:
+                    raise PyFATException(f"Directory loop detected at "
+                                         f"cluster {cluster}, filesystem "
+                                         f"most likely corrupted.",
+                                         errno=errno.ELOOP)
+                parent = parent._parent
+
+            subdirs = self.__parse_dir_entries_in_cluster_chain(cluster)
+            for d in subdirs:
+                dir_entry.add_subdirectory(d)
+            queue.extend(subdirs)
+
     def get_data_cluster_address(self, cluster: int) -> int:
         """Get offset of given cluster in bytes.
 
@@ -794,55 +886,84 @@ class PyFat(object):
         :returns: Bytes address location of cluster
         """
         # First two cluster entries are reserved
-        sector = (cluster - 2) * self.bpb_header["BPB_SecPerClus"] + \
-            self.first_data_sector
-        return sector * self.bpb_header["BPB_BytsPerSec"]
+        return (cluster - 2) * self.bytes_per_cluster + \
+            self.__first_data_byte
 
     @_init_check
     def get_cluster_chain(self, first_cluster):
         """Follow a cluster chain beginning with the first cluster address."""
+        # Bind invariant values to locals, they are used on every hop
         cluster_vals = self.FAT_CLUSTER_VALUES[self.fat_type]
         min_data_cluster = cluster_vals["MIN_DATA_CLUSTER"]
         max_data_cluster = cluster_vals["MAX_DATA_CLUSTER"]
         eoc_min = cluster_vals["END_OF_CLUSTER_MIN"]
         eoc_max = cluster_vals["END_OF_CLUSTER_MAX"]
+        bad_cluster = cluster_vals["BAD_CLUSTER"]
+        free_cluster = cluster_vals["FREE_CLUSTER"]
+        is_fat12 = self.fat_type == self.FAT_TYPE_FAT12
+        fat = self.fat
+        fat_len = len(fat)
 
         i = first_cluster
-        while i <= len(self.fat):
-            if min_data_cluster <= self.fat[i] <= max_data_cluster:
+        while i <= fat_len:
+            next_cluster = fat[i]
+            if min_data_cluster <= next_cluster <= max_data_cluster:
                 # Normal data cluster, follow chain
                 yield i
-            elif self.fat_type == self.FAT_TYPE_FAT12 and \
-                    self.fat[i] == self.FAT12_SPECIAL_EOC:
+            elif is_fat12 and next_cluster == self.FAT12_SPECIAL_EOC:
                 # Special EOC
                 yield i
                 return
-            elif eoc_min <= self.fat[i] <= eoc_max:
+            elif eoc_min <= next_cluster <= eoc_max:
                 # End of cluster, end chain
                 yield i
                 return
-            elif self.fat[i] == cluster_vals["BAD_CLUSTER"]:
+            elif next_cluster == bad_cluster:
                 # Bad cluster, cannot follow chain, file broken!
                 raise PyFATException("Bad cluster found in FAT cluster "
                                      "chain, cannot access file")
-            elif self.fat[i] == cluster_vals["FREE_CLUSTER"]:
+            elif next_cluster == free_cluster:
                 # FREE_CLUSTER mark when following a chain is treated an error
                 raise PyFATException("FREE_CLUSTER mark found in FAT cluster "
                                      "chain, cannot access file")
             else:
                 raise PyFATException("Invalid or unknown FAT cluster "
                                      "entry found with value "
-                                     "\'{}\'".format(hex(self.fat[i])))
+                                     "\'{}\'".format(hex(next_cluster)))
 
-            i = self.fat[i]
+            i = next_cluster
+
+    @_init_check
+    def get_cluster_chain_runs(self, first_cluster):
+        """Follow a cluster chain and group consecutive clusters.
+
+        :param first_cluster: `int`: First cluster of the chain
+        :returns: Generator of `(cluster, num_clusters)` tuples, one
+                  per run of consecutive clusters in the chain
+        """
+        run_start = None
+        run_length = 0
+        for c in self.get_cluster_chain(first_cluster):
+            if run_start is not None and c == run_start + run_length:
+                run_length += 1
+                continue
+
+            if run_start is not None:
+                yield run_start, run_length
+            run_start = c
+            run_length = 1
+
+        if run_start is not None:
+            yield run_start, run_length
 
     @_init_check
     def close(self):
         """Close session and free up all handles."""
-        if not self.is_read_only:
-            self._mark_clean()
+        if self.__fp is not None:
+            if not self.is_read_only:
+                self._mark_clean()
 
-        self.__fp.close()
+            self.__fp.close()
         self.initialized = False
 
     def __del__(self):
@@ -918,7 +1039,7 @@ class PyFat(object):
             boot_sector = self.__fp.read(512)
 
         self.bpb_header = BootSectorHeader()
-        self.bpb_header.parse_header(boot_sector[:36])
+        self.bpb_header.parse_header(boot_sector)
 
         # Verify BPB headers
         self.__verify_bpb_header()
@@ -946,11 +1067,10 @@ class PyFat(object):
         # Calculate first data sector
         self.first_data_sector = (rsvd_secs + (num_fats * self._fat_size) +
                                   self.root_dir_sectors)
+        self.__first_data_byte = self.first_data_sector * bytes_per_sec
 
         # Check signature
-        with self.__lock:
-            self.__seek(510)
-            signature = struct.unpack("<H", self.__fp.read(2))[0]
+        signature = struct.unpack_from("<H", boot_sector, 510)[0]
 
         if signature != 0xAA55:
             raise PyFATException(f"Invalid signature: \'{hex(signature)}\'.")
@@ -1075,8 +1195,8 @@ class PyFat(object):
         if not volume_id:
             # generate random but valid volume id
             tm = time.localtime()
-            cdate = ((tm[0]-1980) << 9) | (tm[1] << 5) | (tm[2])
-            ctime = (tm[3] << 11) | (tm[4] << 5) | (tm[5]//2)
+            cdate = DosDateTime.pack_date(*tm[0:3])
+            ctime = DosDateTime.pack_time(*tm[3:6])
             volume_id = cdate << 16 | ctime
 
         num_sec = math.ceil(size / sector_size)
@@ -1181,6 +1301,7 @@ class PyFat(object):
         self.bytes_per_cluster = sec_per_clus * sector_size
         self.first_data_sector = \
             rsvd_sec_cnt + number_of_fats * self._fat_size
+        self.__first_data_byte = self.first_data_sector * sector_size
 
         self.bpb_header.update({
             "BS_jmpBoot":
@@ -4,6 +4,7 @@
 import datetime
 import posixpath
 import errno
+import itertools
 from copy import copy
 from io import BytesIO, IOBase
 from typing import Union
@@ -170,7 +171,7 @@ class PyFatFS(FS):
             if e.errno == errno.ENOTDIR:
                 raise DirectoryExpected(path)
             raise e
-        return [str(e) for e in dirs+files]
+        return [str(e) for e in itertools.chain(dirs, files)]
 
     def create(self, path: str, wipe: bool = False) -> bool:
         """Create a new file.
@@ -201,8 +202,7 @@ class PyFatFS(FS):
                 # Clean up existing file contents
                 dt = DosDateTime.now(tz=self.tz)
                 dentry.wrttime = dt.serialize_time()
-                dentry.wrtdate = dt.serialize_date()
-                dentry.lstaccessdate = dt.serialize_date()
+                dentry.wrtdate = dentry.lstaccessdate = dt.serialize_date()
                 dentry.filesize = 0
                 old_cluster = dentry.get_cluster()
                 dentry.set_cluster(0)
@@ -9,6 +9,8 @@ pyfatfs allows interaction with FAT12/16/32 filesystems, either via
 or direct interaction with the filesystem for low-level access.
 """
 
+import functools
+
 #: Specifies default ("OEM") encoding
 from pyfatfs._exceptions import PyFATException
 
@@ -18,13 +20,12 @@ FAT_LFN_ENCODING = 'utf-16-le'
 
 
 def _init_check(func):
-    def _wrapper(*args, **kwargs):
-        initialized = args[0].initialized
-
-        if initialized is True:
-            return func(*args, **kwargs)
-        else:
-            raise PyFATException("Class has not yet been fully initialized, "
-                                 "please instantiate first.")
+    @functools.wraps(func)
+    def _wrapper(self, *args, **kwargs):
+        if self.initialized is True:
+            return func(self, *args, **kwargs)
+
+        raise PyFATException("Class has not yet been fully initialized, "
+                             "please instantiate first.")
 
     return _wrapper
@@ -123,3 +123,12 @@ def test_fromtimestamp():
     ddt = DosDateTime.fromtimestamp(dt.timestamp())
     assert ddt.serialize_date() == 0x5490
     assert ddt.serialize_time() == 0x88AA
+
+
+def test_pack_date_time():
+    """Verify that raw values are packed like serialize_{date,time}."""
+    ddt = DosDateTime(2022, 4, 16, 17, 5, 21)
+    assert DosDateTime.pack_date(2022, 4, 16) == ddt.serialize_date()
+    assert DosDateTime.pack_time(17, 5, 21) == ddt.serialize_time()
+    assert DosDateTime.pack_date(1980, 1, 1) == 0x21
+    assert DosDateTime.pack_time(23, 59, 59) == 0xBF7D
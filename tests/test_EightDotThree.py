@@ -181,12 +181,31 @@ def test_make_8dot3_name_unicode():
     fde._encoding = "UTF-8"
     fde.get_entries.return_value = ([], [], [])
     sfn = EightDotThree(encoding='UTF-8')
-    strname = sfn.make_8dot3_name("🤷.🤷", fde)
-    assert "🤷.🤷" == strname
+    strname = sfn.make_8dot3_name("🤷🤷.🤷", fde)
+    # Each character takes up four bytes in UTF-8
+    assert "🤷🤷" == strname
     assert not sfn.is_8dot3_conform(strname)
     assert sfn.is_8dot3_conform(strname, encoding='UTF-8')
 
 
+def test_make_8dot3_name_multibyte():
+    """Test that generated 8dot3 names fit into 8+3 encoded bytes."""
+    fde = mock.MagicMock()
+    fde._encoding = "MS-Kanji"
+    fde.get_entries.return_value = ([], [], [])
+    sfn = EightDotThree(encoding='MS-Kanji')
+    strname = sfn.make_8dot3_name("漢字漢字漢字.TXT", fde)
+    assert "漢字漢字.TXT" == strname
+    assert sfn.is_8dot3_conform(strname, encoding='MS-Kanji')
+
+    dentry = mock.MagicMock()
+    dentry.get_short_name.return_value = strname
+    fde.get_entries.return_value = ([], [dentry], [])
+    strname = sfn.make_8dot3_name("漢字漢字漢字.TXT", fde)
+    assert "漢字漢~1.TXT" == strname
+    assert sfn.is_8dot3_conform(strname, encoding='MS-Kanji')
+
+
 def test_make_8dot3_name_collision():
     """Test that make_8dot3_filename generates valid 8dot3 filenames."""
     fde = mock.MagicMock()
@@ -225,3 +244,134 @@ def test_set_str_name_non8dot3():
         with pytest.raises(TypeError) as e:
             sfn.set_str_name(n)
             assert e.errno == errno.EINVAL
+
+
+def test_is_8dot3_conform_control_characters():
+    """Verify that control characters are not accepted in 8.3 names."""
+    assert not EightDotThree.is_8dot3_conform("FOO\x01.TXT")
+    assert not EightDotThree.is_8dot3_conform("FOO.T\x1fT")
+
+
+def test_is_8dot3_conform_multibyte_length():
+    """Verify that 8dot3 length limits apply to the encoded name."""
+    is_8dot3_conform = EightDotThree.is_8dot3_conform
+    assert is_8dot3_conform("漢字漢字.TXT", "MS-Kanji")
+    assert not is_8dot3_conform("漢字漢字漢字.TXT", "MS-Kanji")
+    assert not is_8dot3_conform("FOO.漢字", "MS-Kanji")
+    assert is_8dot3_conform("ÀÀÀÀ.TXT", "UTF-8")
+    assert not is_8dot3_conform("ÀÀÀÀÀ.TXT", "UTF-8")
+
+
+def test_is_8dot3_conform_leading_dot():
+    """Verify that leading dots are not treated as extension separator."""
+    assert not EightDotThree.is_8dot3_conform(".FOO")
+    assert not EightDotThree.is_8dot3_conform("..")
+
+
+def test_str_0x05_does_not_modify_name():
+    """Verify that decoding a 0x05 lead byte keeps the on-disk name intact."""
+    sfn = EightDotThree(encoding='MS-Kanji')
+    sfn.set_byte_name(b'\x05\xf2FOO   TXT')
+    assert str(sfn) == "褪FOO.TXT"
+    assert bytes(sfn) == b'\x05\xf2FOO   TXT'
+
+
+def test_make_8dot3_name_collision_short_basename():
+    """Verify that numeric tails do not accumulate on short base names."""
+    fde = mock.MagicMock()
+    fde._encoding = "ASCII"
+    fde_sub = mock.MagicMock()
+    fde_sub.get_short_name.side_effect = ["A.TXT", "A~1.TXT"]
+    fde.get_entries.return_value = ([fde_sub], [fde_sub], [])
+    sfn = EightDotThree()
+    assert sfn.make_8dot3_name("a.txt", fde) == "A~2.TXT"
+
+
+def test_make_8dot3_name_collision_digit_rollover():
+    """Verify that the base name is shortened for longer numeric tails."""
+    fde = mock.MagicMock()
+    fde._encoding = "ASCII"
+    fde_sub = mock.MagicMock()
+    fde_sub.get_short_name.side_effect = ["THISIS.TXT"] + \
+        [f"THISIS~{i}.TXT" for i in range(1, 10)]
+    fde.get_entries.return_value = ([], [fde_sub] * 10, [])
+    sfn = EightDotThree()
+    lfn = sfn.make_8dot3_name("This is a long filename.txt", fde)
+    assert "THISI~10.TXT" == lfn
+
+
+def test_get_unpadded_filename_reset_on_set_name():
+    """Verify that the cached unpadded name is reset on name change."""
+    sfn = EightDotThree()
+    sfn.set_str_name("FOO.TXT")
+    assert sfn.get_unpadded_filename() == "FOO.TXT"
+    sfn.set_byte_name(b"BAR     TXT")
+    assert sfn.get_unpadded_filename() == "BAR.TXT"
+    sfn.set_str_name("BAZ")
+    assert sfn.get_unpadded_filename() == "BAZ"
+
+
+def test_get_unpadded_filename_reset_on_mark_empty():
+    """Verify that the cached unpadded name is reset on mark_empty."""
+    sfn = EightDotThree()
+    sfn.set_str_name("DELETED.TXT")
+    assert sfn.get_unpadded_filename() == "DELETED.TXT"
+    sfn.mark_empty()
+    assert sfn.name[0] == 0xE5
+    assert sfn.get_unpadded_filename() == str(sfn)
+    assert sfn.get_unpadded_filename() != "DELETED.TXT"
+
+
+def test_uninitialized():
+    """Verify that an uninitialized name cannot be used."""
+    sfn = EightDotThree()
+    with pytest.raises(pyfatfs.PyFATException):
+        sfn.checksum()
+    with pytest.raises(pyfatfs.PyFATException):
+        sfn.get_unpadded_filename()
+
+
+def test_set_str_name_multibyte_padding():
+    """Verify that padding is based on the encoded length of the name."""
+    sfn = EightDotThree(encoding='MS-Kanji')
+    sfn.set_str_name("漢字.TXT")
+    assert bytes(sfn) == b"\x8a\xbf\x8e\x9a    TXT"
+    assert str(sfn) == "漢字.TXT"
+
+
+def test_checksum_reset_on_set_name():
+    """Verify that the cached checksum is reset on name change."""
+    sfn = EightDotThree()
+    sfn.set_str_name("FILENAME.TXT")
+    assert sfn.checksum() == 58
+    sfn.set_byte_name(b"FOO     BAR")
+    assert sfn.checksum() == calculate_checksum_referenceimpl(sfn.name)
+
+
+def test_checksum_reset_on_mark_empty():
+    """Verify that the cached checksum is reset on mark_empty."""
+    sfn = EightDotThree()
+    sfn.set_str_name("DELETED.TXT")
+    assert sfn.checksum() == calculate_checksum_referenceimpl(sfn.name)
+    sfn.mark_empty()
+    assert sfn.checksum() == calculate_checksum_referenceimpl(sfn.name)
+
+
+def test_pad_8dot3_name_multibyte_overflow():
+    """Verify that names exceeding 8+3 encoded bytes are not padded."""
+    with pytest.raises(pyfatfs.PyFATException) as e:
+        EightDotThree._pad_8dot3_name("漢字漢字漢字.TXT", "MS-Kanji")
+    assert e.value.errno == errno.EINVAL
+    with pytest.raises(pyfatfs.PyFATException) as e:
+        EightDotThree._pad_8dot3_name("FOO.ÀÀ", "UTF-8")
+    assert e.value.errno == errno.EINVAL
+
+
+def test_set_str_name_invalid_length():
+    """Verify that a padded name must be exactly 11 bytes long."""
+    sfn = EightDotThree()
+    with mock.patch.object(EightDotThree, "_pad_8dot3_name",
+                           return_value=b"FOOBARBAZ   TXT"):
+        with pytest.raises(ValueError):
+            sfn.set_str_name("FOO.TXT")
+    assert not sfn.initialized
@@ -4,11 +4,13 @@
 
 import datetime
 import errno
+import sys
 
 import pytest
 from pyfatfs import PyFATException
 from pyfatfs.EightDotThree import EightDotThree
-from pyfatfs.FATDirectoryEntry import FATDirectoryEntry
+from pyfatfs.FATDirectoryEntry import FATDirectoryEntry, \
+    FATLongDirectoryEntry, make_lfn_entry
 
 
 def test_bytes_0xe5():
@@ -18,7 +20,7 @@ def test_bytes_0xe5():
     assert str(sfn) == "褪せる褪"
     dentry = FATDirectoryEntry.new(name=sfn, tz=datetime.timezone.utc,
                                    encoding='MS-Kanji')
-    assert bytes(dentry)[:2] == b'\xe5\xf2'
+    assert bytes(dentry)[:2] == b'\x05\xf2'
     assert bytes(dentry)[:8][-2:] == b'\xe5\xf2'
     assert str(dentry) == "褪せる褪"
 
@@ -104,6 +106,28 @@ def test_walk():
         files.pop(0)
 
 
+def test_walk_deep_tree():
+    """Test that walk does not recurse into deeply nested directories."""
+    tz = datetime.timezone.utc
+    depth = sys.getrecursionlimit() + 100
+    sfn = EightDotThree()
+    sfn.set_str_name("ROOTDIR")
+    rootdir = FATDirectoryEntry.new(name=sfn, tz=tz, encoding='ASCII',
+                                    attr=FATDirectoryEntry.ATTR_DIRECTORY)
+    parent = rootdir
+    for _ in range(depth):
+        sfn = EightDotThree()
+        sfn.set_str_name("D")
+        dentry = FATDirectoryEntry.new(name=sfn, tz=tz, encoding='ASCII',
+                                       attr=FATDirectoryEntry.ATTR_DIRECTORY)
+        parent.add_subdirectory(dentry)
+        parent = dentry
+
+    walked = list(rootdir.walk())
+    assert len(walked) == depth + 1
+    assert walked[-1][0] == "ROOTDIR/" + "/".join(["D"] * depth)
+
+
 def test_filesize_2big_new():
     """Verify that file size is boundary checked in constructor."""
     tz = datetime.timezone.utc
@@ -136,3 +160,183 @@ def test_filesize_2big_set():
     dentry.filesize = FATDirectoryEntry.MAX_FILE_SIZE
     assert dentry.filesize == FATDirectoryEntry.MAX_FILE_SIZE
     assert bytes(dentry)[-4:] == b'\xff\xff\xff\xff'
+
+
+def test_lfn_name_cache_reset():
+    """Test that the cached long name is reset when adding LFN entries."""
+    sfn = EightDotThree()
+    sfn.set_str_name("LONGFI~1.TXT")
+    lfn = make_lfn_entry("long filename 1234567.txt", sfn)
+    assert str(lfn) == "long filename 1234567.txt"
+
+    partial = FATLongDirectoryEntry()
+    partial.add_lfn_entry(**lfn.lfn_entries[1])
+    assert str(partial) == "long filename"
+    assert not partial.is_lfn_entry_complete()
+    partial.add_lfn_entry(**lfn.lfn_entries[0x40 | 2])
+    assert str(partial) == "long filename 1234567.txt"
+    assert partial.is_lfn_entry_complete()
+
+
+def test_lfn_name_padding():
+    """Test that 0xFFFF padding and NUL terminator are stripped."""
+    sfn = EightDotThree()
+    sfn.set_str_name("LONGFI~1.TXT")
+    lfn = make_lfn_entry("long filename.txt", sfn)
+    assert lfn.lfn_entries[0x40 | 2]["LDIR_Name3"] == b'\xFF' * 4
+    assert str(lfn) == "long filename.txt"
+
+
+def test_get_entry():
+    """Test lookup of entries by short and long name."""
+    tz = datetime.timezone.utc
+    rootdir = FATDirectoryEntry.new(name="rootdir", tz=tz, encoding='ASCII',
+                                    attr=FATDirectoryEntry.ATTR_DIRECTORY)
+    sfn = EightDotThree()
+    sfn.set_str_name("FOO.TXT")
+    foo = FATDirectoryEntry.new(name=sfn, tz=tz, encoding='ASCII')
+    rootdir.add_subdirectory(foo)
+    assert rootdir.get_entry("FOO.TXT") is foo
+
+    sfn = EightDotThree()
+    sfn.set_str_name("LONGFI~1.TXT")
+    bar = FATDirectoryEntry.new(name=sfn, tz=tz, encoding='ASCII')
+    bar.set_lfn_entry(make_lfn_entry("long filename.txt", sfn))
+    rootdir.add_subdirectory(bar)
+    assert rootdir.get_entry("long filename.txt") is bar
+    assert rootdir.get_entry("LONGFI~1.TXT") is bar
+
+    rootdir.remove_dir_entry("FOO.TXT")
+    with pytest.raises(PyFATException) as e:
+        rootdir.get_entry("FOO.TXT")
+    assert e.value.errno == errno.ENOENT
+
+
+def test_get_entries_cache():
+    """Test that entries are cached and refreshed on changes."""
+    tz = datetime.timezone.utc
+    rootdir = FATDirectoryEntry.new(name="rootdir", tz=tz, encoding='ASCII',
+                                    attr=FATDirectoryEntry.ATTR_DIRECTORY)
+    sfn = EightDotThree()
+    sfn.set_str_name("FOO")
+    foo = FATDirectoryEntry.new(sfn, tz=tz, encoding='ASCII')
+    rootdir.add_subdirectory(foo)
+    dirs, files, _ = rootdir.get_entries()
+    assert (dirs, files) == ([], [foo])
+    assert rootdir.get_entries()[1] is files
+
+    sfn = EightDotThree()
+    sfn.set_str_name("BAR")
+    bar = FATDirectoryEntry.new(sfn, tz=tz, encoding='ASCII',
+                                attr=FATDirectoryEntry.ATTR_DIRECTORY)
+    rootdir.add_subdirectory(bar)
+    assert rootdir.get_entries()[:2] == ([bar], [foo])
+
+    # walk hands out copies of the cached lists
+    _, walk_dirs, walk_files = next(rootdir.walk())
+    walk_dirs.clear()
+    walk_files.clear()
+    assert rootdir.get_entries()[:2] == ([bar], [foo])
+
+
+def test_mark_empty_short_name():
+    """Verify that the short name reflects the free entry mark."""
+    tz = datetime.timezone.utc
+    sfn = EightDotThree()
+    sfn.set_str_name("DELETED.TXT")
+    dentry = FATDirectoryEntry.new(name=sfn, tz=tz, encoding='ASCII')
+    assert dentry.get_short_name() == "DELETED.TXT"
+    dentry.mark_empty()
+    assert bytes(dentry)[0] == FATDirectoryEntry.FREE_DIR_ENTRY_MARK
+    assert dentry.get_short_name() == str(sfn)
+
+
+def test_get_entry_after_mark_empty():
+    """Verify that an entry marked empty cannot be found by name."""
+    tz = datetime.timezone.utc
+    rootdir = FATDirectoryEntry.new(name="rootdir", tz=tz, encoding='ASCII',
+                                    attr=FATDirectoryEntry.ATTR_DIRECTORY)
+    sfn = EightDotThree()
+    sfn.set_str_name("DELETED.TXT")
+    dentry = FATDirectoryEntry.new(name=sfn, tz=tz, encoding='ASCII')
+    rootdir.add_subdirectory(dentry)
+    assert rootdir.get_entry("DELETED.TXT") is dentry
+    dentry.mark_empty()
+    with pytest.raises(PyFATException) as e:
+        rootdir.get_entry("DELETED.TXT")
+    assert e.value.errno == errno.ENOENT
+
+
+def test_get_entry_after_set_lfn_entry():
+    """Verify that a long name set later can be used to find an entry."""
+    tz = datetime.timezone.utc
+    rootdir = FATDirectoryEntry.new(name="rootdir", tz=tz, encoding='ASCII',
+                                    attr=FATDirectoryEntry.ATTR_DIRECTORY)
+    sfn = EightDotThree()
+    sfn.set_str_name("LONGNA~1.TXT")
+    dentry = FATDirectoryEntry.new(name=sfn, tz=tz, encoding='ASCII')
+    rootdir.add_subdirectory(dentry)
+    assert rootdir.get_entry("LONGNA~1.TXT") is dentry
+    dentry.set_lfn_entry(make_lfn_entry("long name.txt", sfn))
+    assert rootdir.get_entry("long name.txt") is dentry
+
+
+def test_get_entries_after_attr_change():
+    """Verify that entries are reclassified when attributes change."""
+    tz = datetime.timezone.utc
+    rootdir = FATDirectoryEntry.new(name="rootdir", tz=tz, encoding='ASCII',
+                                    attr=FATDirectoryEntry.ATTR_DIRECTORY)
+    sfn = EightDotThree()
+    sfn.set_str_name("FOO")
+    dentry = FATDirectoryEntry.new(name=sfn, tz=tz, encoding='ASCII')
+    rootdir.add_subdirectory(dentry)
+    assert rootdir.get_entries() == ([], [dentry], [])
+    dentry.attr = FATDirectoryEntry.ATTR_DIRECTORY
+    assert rootdir.get_entries() == ([dentry], [], [])
+
+
+def test_lfn_mark_empty_resets_name():
+    """Verify that the cached long name is reset on mark_empty."""
+    sfn = EightDotThree()
+    sfn.set_str_name("LONGNA~1.TXT")
+    lfn_entry = make_lfn_entry("a rather long file name.txt", sfn)
+
+    def from_disk_order():
+        # LFN entries are stored on disk starting with the last one
+        entry = FATLongDirectoryEntry()
+        for e in lfn_entry.get_entries(reverse=True):
+            entry.add_lfn_entry(**e)
+        return entry
+
+    cached, uncached = from_disk_order(), from_disk_order()
+    assert str(cached) == "a rather long file name.txt"
+    cached.mark_empty()
+    uncached.mark_empty()
+    assert str(cached) == str(uncached)
+
+
+def test_lfn_mark_empty_incomplete():
+    """Verify that an LFN entry marked empty is no complete chain."""
+    sfn = EightDotThree()
+    sfn.set_str_name("LONGNA~1.TXT")
+    lfn_entry = make_lfn_entry("a rather long file name.txt", sfn)
+    assert lfn_entry.is_lfn_entry_complete()
+    lfn_entry.mark_empty()
+    assert not lfn_entry.is_lfn_entry_complete()
+
+
+def test_attr_predicates_follow_attr():
+    """Verify that attribute checks reflect changes of attr."""
+    tz = datetime.timezone.utc
+    sfn = EightDotThree()
+    sfn.set_str_name("FOO")
+    dentry = FATDirectoryEntry.new(name=sfn, tz=tz, encoding='ASCII',
+                                   attr=FATDirectoryEntry.ATTR_READ_ONLY)
+    assert dentry.is_read_only()
+    assert not dentry.is_hidden()
+    dentry.attr |= FATDirectoryEntry.ATTR_HIDDEN
+    assert dentry.is_read_only()
+    assert dentry.is_hidden()
+    dentry.attr = FATDirectoryEntry.ATTR_DIRECTORY
+    assert not dentry.is_read_only()
+    assert dentry.is_directory()
@@ -5,15 +5,73 @@ import datetime
 import errno
 from io import BytesIO
 from unittest import mock
+import warnings
 
 import pyfatfs
 import pytest
 
 from pyfatfs import PyFATException
-from pyfatfs.FATDirectoryEntry import FATDirectoryEntry
+from pyfatfs.EightDotThree import EightDotThree
+from pyfatfs.FATDirectoryEntry import FATDirectoryEntry, make_lfn_entry
 from pyfatfs.PyFat import PyFat
 
 
+@pytest.fixture
+def fat12_image():
+    """Empty 4 MB FAT12 filesystem image created by mkfs."""
+    pf = PyFat()
+    in_memory_fs = BytesIO(b'\0' * 4 * 1024 * 1024)
+    pf._PyFat__fp = in_memory_fs
+    with mock.patch('pyfatfs.PyFat.PyFat._PyFat__set_fp',
+                    mock.Mock()):
+        with mock.patch('pyfatfs.PyFat.open'):
+            pf.mkfs("/this/does/not/exist.img",
+                    fat_type=PyFat.FAT_TYPE_FAT12,
+                    size=1024 * 1024 * 4)
+    pf.initialized = False
+    return in_memory_fs.getvalue()
+
+
+@pytest.fixture
+def fat12_fp(fat12_image):
+    """In-memory file object holding `fat12_image`."""
+    return BytesIO(fat12_image)
+
+
+@pytest.fixture
+def fat12_fs(fat12_fp):
+    """Open `fat12_fp` with a new `PyFat` instance."""
+    pf = PyFat()
+    pf.set_fp(fat12_fp)
+    yield pf
+    pf.close()
+
+
+@pytest.fixture
+def fat_region_fs():
+    """Create `PyFat` instances backed only by a raw FAT region.
+
+    The returned callable takes the FAT type, the raw bytes of all
+    FAT copies and the number of FATs; each FAT is one sector long.
+    """
+    instances = []
+
+    def make(fat_type, fats, num_fats=1):
+        pf = PyFat()
+        pf._PyFat__fp = BytesIO(b'\0' * 512 + fats)
+        pf.bpb_header = {"BPB_BytsPerSec": 512, "BPB_RsvdSecCnt": 1,
+                         "BPB_NumFATs": num_fats, "BPB_SecPerClus": 1}
+        pf._fat_size = 1
+        pf.fat_type = fat_type
+        pf.initialized = True
+        instances.append(pf)
+        return pf
+
+    yield make
+    for pf in instances:
+        pf.initialized = False
+
+
 def test_set_fp_bytesio():
     """Test that BytesIO can be set via PyFat.set_fp."""
     pf = PyFat(encoding='UTF-8')
@@ -347,6 +405,14 @@ def test_get_fs_location():
         pf.get_fs_location()
 
 
+def test_close_no_fp():
+    """Test that close does not fail without a file handle."""
+    pf = PyFat()
+    pf.initialized = True
+    pf.close()
+    assert not pf.initialized
+
+
 def test_allocate_bytes_readonly():
     """Test that allocate_bytes cannot be called on read-only FS."""
     pf = PyFat()
@@ -398,3 +464,213 @@ def test_write_data_to_cluster_readonly():
     with pytest.raises(PyFATException) as e:
         pf.write_data_to_cluster(b'foo', 4711)
     assert e.value.errno == errno.EROFS
+
+
+def test_parse_dir_entries(fat12_fs, fat12_fp):
+    """Test that written directory entries are parsed back from disk."""
+    pf = fat12_fs
+    tz = datetime.timezone.utc
+    for name, lfn in [("FOO.TXT", None),
+                      ("DELETED.TXT", None),
+                      ("LONGFI~1.TXT", "long filename.txt")]:
+        sfn = EightDotThree()
+        sfn.set_str_name(name)
+        dentry = FATDirectoryEntry.new(name=sfn, tz=tz,
+                                       encoding=pyfatfs.FAT_OEM_ENCODING)
+        if lfn is not None:
+            dentry.set_lfn_entry(make_lfn_entry(lfn, sfn))
+        pf.root_dir.add_subdirectory(dentry)
+    pf.root_dir.get_entry("DELETED.TXT").mark_empty()
+    pf.update_directory_entry(pf.root_dir)
+    pf._mark_clean()
+
+    pf2 = PyFat()
+    pf2.set_fp(BytesIO(fat12_fp.getvalue()))
+    _, files, specials = pf2.root_dir.get_entries()
+    assert [str(f) for f in files] == ["FOO.TXT", "long filename.txt"]
+    assert files[1].get_short_name() == "LONGFI~1.TXT"
+    assert [s.is_volume_id() for s in specials] == [True]
+
+
+def test_read_cluster_contents_partial(fat12_fs):
+    """Test reading parts of a cluster via offset and size."""
+    pf = fat12_fs
+    data = bytes(range(256)) * (pf.bytes_per_cluster // 256)
+    cluster = pf.allocate_bytes(len(data))[0]
+    pf.write_data_to_cluster(data, cluster)
+    assert pf.read_cluster_contents(cluster) == data
+    assert pf.read_cluster_contents(cluster, 10) == data[10:]
+    assert pf.read_cluster_contents(cluster, 10, 5) == data[10:15]
+    assert pf.read_cluster_contents(cluster, size=0) == b''
+    assert pf.read_cluster_contents(cluster, 10, len(data)) == data[10:]
+    buffer = bytearray(len(data) + 10)
+    assert pf.read_cluster_contents_into(cluster, buffer, 10) == len(data) - 10
+    assert buffer[:len(data) - 10] == data[10:]
+
+
+def test_parse_dir_entries_stops_at_last_entry(fat12_fs):
+    """Test that clusters following the end of directory mark are ignored."""
+    pf = fat12_fs
+    sfn = EightDotThree()
+    sfn.set_str_name("STALE.TXT")
+    dentry = FATDirectoryEntry.new(name=sfn, tz=datetime.timezone.utc,
+                                   encoding=pyfatfs.FAT_OEM_ENCODING)
+    first, second = pf.allocate_bytes(2 * pf.bytes_per_cluster, erase=True)
+    pf.write_data_to_cluster(bytes(dentry), second)
+    assert len(pf.parse_dir_entries_in_cluster_chain(second)) == 1
+    assert pf.parse_dir_entries_in_cluster_chain(first) == []
+
+
+def test_parse_fat12(fat_region_fs):
+    """Test that FAT12 entries are split into 12-bit values."""
+    fat = bytes([0xF8, 0xFF, 0xFF, 0x03, 0x40, 0x00]) + b'\0' * 506
+    pf = fat_region_fs(PyFat.FAT_TYPE_FAT12, fat)
+    pf._parse_fat()
+    assert pf.fat[:4] == [0xFF8, 0xFFF, 0x003, 0x004]
+    assert len(pf.fat) == 341
+    assert bytes(pf) == fat
+
+
+@pytest.mark.parametrize("fat_type", [PyFat.FAT_TYPE_FAT16,
+                                      PyFat.FAT_TYPE_FAT32])
+def test_fat_bytes_roundtrip(fat_region_fs, fat_type):
+    """Test that FAT16/32 entries are serialized as little endian."""
+    entry_size = fat_type // 8
+    fat = bytes(range(16)) + b'\0' * (512 - 16)
+    pf = fat_region_fs(fat_type, fat)
+    pf._parse_fat()
+    assert len(pf.fat) == 512 // entry_size
+    assert pf.fat[1] == int.from_bytes(fat[entry_size:2 * entry_size],
+                                       "little")
+    assert bytes(pf) == fat
+
+
+def test_parse_fat_differing_fats(fat_region_fs):
+    """Test that differing FAT copies are detected and the first is used."""
+    fat = b'\xF8\xFF\xFF\xFF' + b'\0' * 508
+    fat2 = fat[:-1] + b'\x01'
+    pf = fat_region_fs(PyFat.FAT_TYPE_FAT16, fat + fat + fat2, num_fats=2)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        pf._parse_fat()
+    pf.bpb_header["BPB_NumFATs"] = 3
+    with pytest.warns(UserWarning, match="One or more FATs differ"):
+        pf._parse_fat()
+    with mock.patch.object(PyFat, "FAT_COMPARE_CHUNK_SIZE", 100):
+        with pytest.warns(UserWarning, match="One or more FATs differ"):
+            pf._parse_fat()
+    assert pf.fat[:2] == [0xFFF8, 0xFFFF]
+    assert pf.fat[-1] == 0
+
+
+def test_get_cluster_chain_runs():
+    """Test grouping of consecutive clusters in a cluster chain."""
+    pf = PyFat()
+    pf.initialized = True
+    pf.fat_type = PyFat.FAT_TYPE_FAT16
+    pf.fat = [0xFFF8, 0xFFFF, 3, 4, 8, 0, 0, 0, 9, 0xFFFF, 0xFFFF]
+    assert list(pf.get_cluster_chain_runs(2)) == [(2, 3), (8, 2)]
+    assert list(pf.get_cluster_chain_runs(3)) == [(3, 2), (8, 2)]
+    assert list(pf.get_cluster_chain_runs(10)) == [(10, 1)]
+    pf.initialized = False
+
+
+def test_parse_dir_entries_directory_loop(fat12_fs, fat12_fp):
+    """Test that a directory containing its parent raises ELOOP."""
+    pf = fat12_fs
+    cluster = pf.allocate_bytes(pf.bytes_per_cluster, erase=True)[0]
+    pf.flush_fat()
+    tz = datetime.timezone.utc
+    for name in ["LOOP", "SELF"]:
+        sfn = EightDotThree()
+        sfn.set_str_name(name)
+        dentry = FATDirectoryEntry.new(name=sfn, tz=tz,
+                                       encoding=pyfatfs.FAT_OEM_ENCODING,
+                                       attr=FATDirectoryEntry.ATTR_DIRECTORY,
+                                       cluster=cluster)
+        if name == "LOOP":
+            pf.root_dir.add_subdirectory(dentry)
+            pf.update_directory_entry(pf.root_dir)
+        else:
+            pf.write_data_to_cluster(bytes(dentry), cluster)
+    pf._mark_clean()
+
+    pf2 = PyFat(lazy_load=False)
+    with pytest.raises(PyFATException) as e:
+        pf2.set_fp(BytesIO(fat12_fp.getvalue()))
+    assert e.value.errno == errno.ELOOP
+
+
+def test_parse_header_invalid_signature(fat12_image):
+    """Test that a boot sector without 0xAA55 signature is rejected."""
+    image = bytearray(fat12_image)
+    image[510:512] = b'\x55\xAB'
+    pf2 = PyFat()
+    with pytest.raises(PyFATException, match="Invalid signature"):
+        pf2.set_fp(BytesIO(image))
+
+
+def test_allocate_bytes_last_cluster():
+    """Test that the last cluster of the FAT can be allocated."""
+    pf = PyFat()
+    pf.initialized = True
+    pf.is_read_only = False
+    pf.fat_type = PyFat.FAT_TYPE_FAT16
+    pf.bytes_per_cluster = 512
+    pf.fat = [0xFFF8, 0xFFFF, 0xFFFF, 0x0000, 0xFFFF, 0x0000]
+    assert pf.allocate_bytes(1024) == [3, 5]
+    assert pf.fat == [0xFFF8, 0xFFFF, 0xFFFF, 5, 0xFFFF, 0xFFFF]
+    assert pf.first_free_cluster == 6
+    with pytest.raises(PyFATException) as e:
+        pf.allocate_bytes(1)
+    assert e.value.errno == errno.ENOSPC
+    pf.initialized = False
+
+
+def test_read_cluster_contents_into_consecutive(fat12_fs):
+    """Test reading consecutive clusters into a buffer at once."""
+    pf = fat12_fs
+    first, second = pf.allocate_bytes(2 * pf.bytes_per_cluster)
+    assert second == first + 1
+    pf.write_data_to_cluster(b'\1' * pf.bytes_per_cluster, first)
+    pf.write_data_to_cluster(b'\2' * pf.bytes_per_cluster, second)
+    buffer = bytearray(3 * pf.bytes_per_cluster)
+    size = 2 * pf.bytes_per_cluster - 10
+    assert pf.read_cluster_contents_into(first, buffer, 10, 2) == size
+    assert buffer[:size] == b'\1' * (pf.bytes_per_cluster - 10) + \
+        b'\2' * pf.bytes_per_cluster
+
+
+def test_multibyte_names_roundtrip(fat12_image):
+    """Test that multi-byte names are written and parsed back intact."""
+    fp = BytesIO(fat12_image)
+    pf = PyFat(encoding="UTF-8")
+    pf.set_fp(fp)
+    tz = datetime.timezone.utc
+    names = ["ÀÀÀÀ.TXT", "ÀÀÀÀÀ.TXT", "très long document.txt"]
+    for name in names:
+        sfn = EightDotThree(encoding=pf.encoding)
+        lfn = None
+        if EightDotThree.is_8dot3_conform(name, pf.encoding):
+            sfn.set_str_name(name)
+        else:
+            sfn.set_str_name(EightDotThree.make_8dot3_name(name,
+                                                           pf.root_dir))
+            lfn = make_lfn_entry(name, sfn)
+        dentry = FATDirectoryEntry.new(name=sfn, tz=tz, encoding=pf.encoding)
+        dentry.set_lfn_entry(lfn)
+        pf.root_dir.add_subdirectory(dentry)
+    pf.update_directory_entry(pf.root_dir)
+    pf._mark_clean()
+    image = fp.getvalue()
+    pf.close()
+
+    pf2 = PyFat(encoding="UTF-8")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        pf2.set_fp(BytesIO(image))
+    _, files, _ = pf2.root_dir.get_entries()
+    assert [str(f) for f in files] == names
+    assert [f.get_short_name() for f in files] == \
+        ["ÀÀÀÀ.TXT", "ÀÀÀ~1.TXT", "TRÈSLON.TXT"]
+    pf2.close()